@@ -249,8 +249,7 @@ class Command(AsyncCommand):
     def get_filepath(self, options):
         if options["output_file"] is None:
             temp_dir = os.path.join(conf.KOLIBRI_HOME, "temp")
-            if not os.path.isdir(temp_dir):
-                os.mkdir(temp_dir)
+            os.makedirs(temp_dir, exist_ok=True)
             filepath = mkstemp(suffix=".download", dir=temp_dir)[1]
         else:
             filepath = os.path.join(os.getcwd(), options["output_file"])
@@ -75,11 +75,15 @@ from kolibri.core.device.utils import set_device_settings
 from kolibri.core.errors import KolibriValidationError
 from kolibri.core.fields import DateTimeTzField
 from kolibri.core.fields import JSONField
+from kolibri.core.utils.cache import process_cache
 from kolibri.plugins.app.utils import interface
 from kolibri.utils.time_utils import local_now
 
 logger = logging.getLogger(__name__)
 
+# Cache key for a facility's on my own setup flag, cleared whenever it is set.
+ON_MY_OWN_SETUP_CACHE_KEY = "on_my_own_setup_{}"
+
 
 class DatasetCache(local):
     def __init__(self):
@@ -1428,6 +1432,7 @@ class Facility(Collection):
             self.dataset.extra_fields = {}
         self.dataset.extra_fields["on_my_own_setup"] = value
         self.dataset.save()
+        process_cache.delete(ON_MY_OWN_SETUP_CACHE_KEY.format(self.id))
 
     def __str__(self):
         return self.name
@@ -75,11 +75,12 @@ class FacilityTasksAPITestCase(APITestCase):
         status = job_data.get("state", fake_job_defaults.get("state"))
         self.assertEqual(status, response.data.get("status"))
 
+        # Empty exception and traceback values are left out of the response
         exception = job_data.get("exception", fake_job_defaults.get("exception"))
-        self.assertEqual(exception, response.data.get("exception"))
+        self.assertEqual(exception or None, response.data.get("exception"))
 
         traceback = job_data.get("traceback", fake_job_defaults.get("traceback"))
-        self.assertEqual(traceback, response.data.get("traceback"))
+        self.assertEqual(traceback or None, response.data.get("traceback"))
 
         percentage = job_data.get(
             "percentage_progress", fake_job_defaults.get("percentage_progress")
@@ -107,7 +108,6 @@ class FacilityTasksAPITestCase(APITestCase):
         self.assertEqual(response.status_code, 200)
 
     def test_startdataportalsync(self, mock_job_storage):
-        mock_job_storage.enqueue_job.return_value = 123
         fake_job_data = dict(
             job_id=123,
             state="testing",
@@ -115,7 +115,7 @@ class FacilityTasksAPITestCase(APITestCase):
             cancellable=False,
             extra_metadata=dict(this_is_extra=True),
         )
-        mock_job_storage.get_job.return_value = fake_job(**fake_job_data)
+        mock_job_storage.enqueue_jobs.return_value = [fake_job(**fake_job_data)]
 
         response = self.client.post(
             reverse("kolibri:core:task-list"),
@@ -129,7 +129,7 @@ class FacilityTasksAPITestCase(APITestCase):
         self.assertEqual(response.status_code, 200)
         self.assertJobResponse(fake_job_data, response)
         self.assertEqual(
-            mock_job_storage.enqueue_job.call_args_list[0][0][0].kwargs,
+            mock_job_storage.enqueue_jobs.call_args[0][0][0][0].kwargs,
             dict(
                 facility=self.facility.id,
                 chunk_size=200,
@@ -151,7 +151,7 @@ class FacilityTasksAPITestCase(APITestCase):
             cancellable=False,
             extra_metadata=dict(this_is_extra=True),
         )
-        mock_job_storage.get_job.return_value = fake_job(**fake_job_data)
+        mock_job_storage.enqueue_jobs.return_value = [fake_job(**fake_job_data)] * 2
 
         response = self.client.post(
             reverse("kolibri:core:task-list"),
@@ -166,10 +166,10 @@ class FacilityTasksAPITestCase(APITestCase):
         )
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(2, mock_job_storage.enqueue_job.call_count)
+        self.assertEqual(2, len(mock_job_storage.enqueue_jobs.call_args[0][0]))
 
         self.assertEqual(
-            mock_job_storage.enqueue_job.call_args_list[0][0][0].kwargs,
+            mock_job_storage.enqueue_jobs.call_args[0][0][0][0].kwargs,
             dict(
                 facility=facility2.id,
                 chunk_size=200,
@@ -178,7 +178,7 @@ class FacilityTasksAPITestCase(APITestCase):
             ),
         )
         self.assertEqual(
-            mock_job_storage.enqueue_job.call_args_list[1][0][0].kwargs,
+            mock_job_storage.enqueue_jobs.call_args[0][0][1][0].kwargs,
             dict(
                 facility=facility3.id,
                 chunk_size=200,
@@ -209,7 +209,6 @@ class FacilityTasksAPITestCase(APITestCase):
             baseurl="https://some.server.test/extra/stuff",
         )
 
-        mock_job_storage.enqueue_job.return_value = 123
         fake_job_data = dict(
             job_id=123,
             state="testing",
@@ -218,7 +217,7 @@ class FacilityTasksAPITestCase(APITestCase):
             extra_metadata=dict(this_is_extra=True),
         )
         fake_job_data["extra_metadata"].update(extra_metadata)
-        mock_job_storage.get_job.return_value = fake_job(**fake_job_data)
+        mock_job_storage.enqueue_jobs.return_value = [fake_job(**fake_job_data)]
 
         req_data = dict(
             facility=self.facility.id,
@@ -239,7 +238,7 @@ class FacilityTasksAPITestCase(APITestCase):
         self.assertEqual(response.status_code, 200)
         self.assertJobResponse(fake_job_data, response)
         self.assertEqual(
-            mock_job_storage.enqueue_job.call_args_list[0][0][0].kwargs,
+            mock_job_storage.enqueue_jobs.call_args[0][0][0][0].kwargs,
             dict(
                 baseurl="https://some.server.test/",
                 facility=self.facility.id,
@@ -273,7 +272,6 @@ class FacilityTasksAPITestCase(APITestCase):
             baseurl="https://some.server.test/extra/stuff",
         )
 
-        mock_job_storage.enqueue_job.return_value = 123
         fake_job_data = dict(
             job_id=123,
             state="testing",
@@ -282,7 +280,7 @@ class FacilityTasksAPITestCase(APITestCase):
             extra_metadata=dict(this_is_extra=True),
         )
         fake_job_data["extra_metadata"].update(extra_metadata)
-        mock_job_storage.get_job.return_value = fake_job(**fake_job_data)
+        mock_job_storage.enqueue_jobs.return_value = [fake_job(**fake_job_data)]
 
         req_data = dict(
             facility=self.facility.id,
@@ -304,7 +302,7 @@ class FacilityTasksAPITestCase(APITestCase):
         self.assertJobResponse(fake_job_data, response)
 
         self.assertEqual(
-            mock_job_storage.enqueue_job.call_args_list[0][0][0].kwargs,
+            mock_job_storage.enqueue_jobs.call_args[0][0][0][0].kwargs,
             {
                 "baseurl": "https://some.server.test/",
                 "facility": self.facility.id,
@@ -322,7 +320,6 @@ class FacilityTasksAPITestCase(APITestCase):
             facility_name=facility2.name,
         )
 
-        mock_job_storage.enqueue_job.return_value = 123
         fake_job_data = dict(
             job_id=123,
             state="testing",
@@ -330,7 +327,7 @@ class FacilityTasksAPITestCase(APITestCase):
             extra_metadata=dict(this_is_extra=True),
         )
         fake_job_data["extra_metadata"].update(extra_metadata)
-        mock_job_storage.get_job.return_value = fake_job(**fake_job_data)
+        mock_job_storage.enqueue_jobs.return_value = [fake_job(**fake_job_data)]
 
         response = self.client.post(
             reverse("kolibri:core:task-list"),
@@ -340,7 +337,7 @@ class FacilityTasksAPITestCase(APITestCase):
         self.assertEqual(response.status_code, 200)
         self.assertJobResponse(fake_job_data, response)
         self.assertEqual(
-            mock_job_storage.enqueue_job.call_args_list[0][0][0].args,
+            mock_job_storage.enqueue_jobs.call_args[0][0][0][0].args,
             (facility2.id,),
         )
 
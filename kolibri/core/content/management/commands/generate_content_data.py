@@ -1,11 +1,18 @@
+import binascii
 import logging
+import multiprocessing
+import os
 import random
-import uuid
+from collections import defaultdict
+from collections import deque
+from concurrent import futures
+from contextlib import contextmanager
 
 from django.conf import settings
 from django.core.management import call_command
 from django.core.management.base import BaseCommand
 from django.db import connections
+from django.db import transaction
 from le_utils.constants import content_kinds
 from le_utils.constants import file_formats
 from le_utils.constants import format_presets
@@ -15,6 +22,7 @@ from le_utils.constants.labels import learning_activities
 from le_utils.constants.labels.levels import LEVELSLIST
 from le_utils.constants.labels.needs import NEEDSLIST
 from le_utils.constants.labels.subjects import SUBJECTSLIST
+from morango.sync.backends.utils import calculate_max_sqlite_variables
 
 from kolibri.core.content.apps import KolibriContentConfig
 from kolibri.core.content.models import AssessmentMetaData
@@ -28,10 +36,28 @@ from kolibri.core.content.models import LocalFile
 
 logger = logging.getLogger(__name__)
 
-# we are using a set in case we accidentally tried deleting the same object twice
-generated_objects = set()
+# Model -> pks of the generated objects, only the pks are kept so that the instances
+# can be freed once inserted (a pk listed twice is harmless in the final DELETE)
+generated_ids = defaultdict(list)
 
-tags_generated = []
+# ids of the generated ContentTags, leaves are tagged by id only
+tag_ids_generated = []
+
+# unsaved instances, buffered during generation and inserted in bulk by flush_buffers
+node_buf = []
+localfile_buf = []
+file_buf = []
+assessment_buf = []
+# (contentnode_id, contenttag_id) pairs for the ContentNode.tags through model
+tag_links = []
+
+BUFFERS = (node_buf, localfile_buf, file_buf, assessment_buf, tag_links)
+
+# channel_id -> resource count and language ids of the channel, tallied during generation
+channel_stats = defaultdict(lambda: {"resource_count": 0, "lang_ids": set()})
+
+# upper bound on the number of rows inserted or deleted per statement
+BULK_CREATE_BATCH_SIZE = int(os.environ.get("KOLIBRI_BULK_CREATE_BATCH_SIZE", 1000))
 
 # not used in kolibri yet
 IGNORED_KINDS = ["quiz", "zim"]
@@ -66,17 +92,171 @@ def switch_to_memory():
         call_command("migrate", interactive=False, database=db)
 
 
-# for returning random choices
-def choices(sequence, k):
-    return [random.choice(sequence) for _ in range(0, k)]
+# durability is not needed while generating throwaway data
+FAST_WRITE_PRAGMAS = (
+    ("synchronous", "OFF"),
+    ("journal_mode", "MEMORY"),
+    ("temp_store", "MEMORY"),
+    ("cache_size", "-200000"),
+)
+
+
+@contextmanager
+def fast_sqlite_writes(enabled=True):
+    """
+    Relaxes the durability PRAGMAs of the content database connection for the
+    duration of the block, restoring the previous values on exit - journal_mode
+    in particular is persisted in the database file.
+    """
+    connection = connections[ContentNode.objects.db]
+    if not enabled or connection.vendor != "sqlite":
+        yield
+        return
+
+    with connection.cursor() as cursor:
+        previous_values = []
+        for pragma, value in FAST_WRITE_PRAGMAS:
+            cursor.execute("PRAGMA {}".format(pragma))
+            previous_values.append((pragma, cursor.fetchone()[0]))
+            cursor.execute("PRAGMA {}={}".format(pragma, value))
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            for pragma, value in previous_values:
+                cursor.execute("PRAGMA {}={}".format(pragma, value))
+
+
+def _insert_rows(Model, objects):
+    """
+    Inserts objects by passing their db-prepared field values straight to
+    cursor.executemany, skipping the query building of bulk_create.
+    """
+    connection = connections[Model.objects.db]
+    quote_name = connection.ops.quote_name
+    # as in bulk_create, let the database fill in autoincrementing pks
+    fields = [
+        field
+        for field in Model._meta.concrete_fields
+        if field is not Model._meta.auto_field
+    ]
+    sql = "INSERT INTO {} ({}) VALUES ({})".format(
+        quote_name(Model._meta.db_table),
+        ", ".join(quote_name(field.column) for field in fields),
+        ", ".join(["%s"] * len(fields)),
+    )
+    with connection.cursor() as cursor:
+        for i in range(0, len(objects), BULK_CREATE_BATCH_SIZE):
+            cursor.executemany(
+                sql,
+                [
+                    tuple(
+                        field.get_db_prep_save(field.pre_save(obj, True), connection)
+                        for field in fields
+                    )
+                    for obj in objects[i : i + BULK_CREATE_BATCH_SIZE]
+                ],
+            )
+
+
+def flush_buffers():
+    """
+    Inserts all the buffered instances, FK targets first, then empties the buffers.
+    """
+    _insert_rows(LocalFile, localfile_buf)
+    _insert_rows(ContentNode, node_buf)
+    _insert_rows(File, file_buf)
+    _insert_rows(AssessmentMetaData, assessment_buf)
+
+    ContentNodeTags = ContentNode.tags.through
+    _insert_rows(
+        ContentNodeTags,
+        [
+            ContentNodeTags(contentnode_id=node_id, contenttag_id=tag_id)
+            for node_id, tag_id in tag_links
+        ],
+    )
+
+    for Model, buf in (
+        (LocalFile, localfile_buf),
+        (ContentNode, node_buf),
+        (File, file_buf),
+        (AssessmentMetaData, assessment_buf),
+    ):
+        generated_ids[Model].extend(obj.pk for obj in buf)
+
+    for buf in BUFFERS:
+        del buf[:]
+
+
+def delete_generated_objects():
+    """
+    Deletes the generated objects with one DELETE query per model (and batch)
+    rather than one per object.
+    """
+    # one query variable per pk, keep under the sqlite limit
+    batch_size = min(BULK_CREATE_BATCH_SIZE, calculate_max_sqlite_variables())
+    for Model, pks in generated_ids.items():
+        for i in range(0, len(pks), batch_size):
+            Model.objects.filter(pk__in=pks[i : i + batch_size]).delete()
+
+    generated_ids.clear()
+
+
+def set_tree_fields(root_node, nodes, tree_id):
+    """
+    Sets the mptt fields of the unsaved nodes of a tree,
+    as inserting them in bulk bypasses mptt's own bookkeeping on save.
+    """
+    children = defaultdict(list)
+    for node in nodes:
+        if node.parent is not None:
+            children[node.parent.id].append(node)
+
+    def treeify(node, cursor, level):
+        node.tree_id = tree_id
+        node.level = level
+        node.lft = cursor
+        for child in children[node.id]:
+            cursor = treeify(child, cursor + 1, level + 1)
+        cursor += 1
+        node.rght = cursor
+        return cursor
+
+    treeify(root_node, 1, 0)
+
+
+def bulk_hex_uuids(n):
+    """
+    Returns n random 32 character hex ids, drawn from a single os.urandom call.
+    """
+    raw = binascii.hexlify(os.urandom(16 * n)).decode("ascii")
+    return [raw[i : i + 32] for i in range(0, 32 * n, 32)]
+
+
+def hex_uuids(block_size=1000):
+    while True:
+        for hex_id in bulk_hex_uuids(block_size):
+            yield hex_id
 
 
-# format_presets.PRESETLIST to a dictionary for convenient access
-format_prestets_data = {}
+# the ids of every generated object are handed out from this iterator
+uuid_iter = hex_uuids()
 
-for format_object in format_presets.PRESETLIST:
-    if format_object.kind:
-        format_prestets_data[format_object.id] = format_object
+
+def sample_labels(labels, max_k):
+    """
+    Returns a comma separated string of between 1 and max_k distinct labels.
+    """
+    return ",".join(random.sample(labels, min(random.randint(1, max_k), len(labels))))
+
+
+# the format_presets.PRESETLIST attributes we need, flattened into plain lookups by preset id
+_presets = [preset for preset in format_presets.PRESETLIST if preset.kind]
+
+PRESET_FORMATS = {preset.id: tuple(preset.allowed_formats) for preset in _presets}
+PRESET_SUPPLEMENTARY = {preset.id: preset.supplementary for preset in _presets}
+PRESET_THUMBNAIL = {preset.id: preset.thumbnail for preset in _presets}
 
 
 # purpose : if we have a node of certain kind what type of main_file_preset (not supplementary) should map to that node
@@ -115,6 +295,60 @@ main_file_preset_to_thumbnail_preset = {
 }
 
 
+# mastery criteria with a fixed n (and m)
+NUM_CORRECT_IN_A_ROW = {
+    mastery_criteria.NUM_CORRECT_IN_A_ROW_10: 10,
+    mastery_criteria.NUM_CORRECT_IN_A_ROW_2: 2,
+    mastery_criteria.NUM_CORRECT_IN_A_ROW_3: 3,
+    mastery_criteria.NUM_CORRECT_IN_A_ROW_5: 5,
+}
+
+# precalculated by taking the average file_size of actual existing localfiles
+# instead of just random generated sizes, these are more relvant to the corresponding extension
+EXTENSION_TO_FILE_SIZE = {
+    file_formats.MP4: 5933249,
+    file_formats.WEBM: None,
+    file_formats.VTT: 1242,
+    file_formats.PDF: 6655360,
+    file_formats.EPUB: 13291472,
+    file_formats.MP3: 2102685,
+    file_formats.JPG: 5604683,
+    file_formats.JPEG: 30433803,
+    file_formats.PNG: 609113,
+    file_formats.GIF: None,
+    file_formats.JSON: 3529,
+    file_formats.SVG: None,
+    file_formats.GRAPHIE: None,
+    file_formats.PERSEUS: 131841,
+    file_formats.H5P: 10699889,
+    file_formats.ZIM: None,
+    file_formats.HTML5: 1315774,
+}
+
+KIND_TO_LEARNING_ACTIVITIES = {
+    content_kinds.TOPIC: "",
+    content_kinds.SLIDESHOW: "",
+    content_kinds.DOCUMENT: "{},{}".format(
+        learning_activities.READ, learning_activities.REFLECT
+    ),
+    content_kinds.VIDEO: "{},{}".format(
+        learning_activities.WATCH, learning_activities.REFLECT
+    ),
+    content_kinds.HTML5: "{},{}".format(
+        learning_activities.EXPLORE, learning_activities.REFLECT
+    ),
+    content_kinds.AUDIO: "{},{}".format(
+        learning_activities.LISTEN, learning_activities.REFLECT
+    ),
+    content_kinds.EXERCISE: "{},{}".format(
+        learning_activities.PRACTICE, learning_activities.REFLECT
+    ),
+    content_kinds.H5P: "{}.{}".format(
+        learning_activities.EXPLORE, learning_activities.REFLECT
+    ),
+}
+
+
 def generate_some_tags():
 
     # dummy tag names
@@ -133,14 +367,28 @@ def generate_some_tags():
         "nice tag",
     ]
 
-    for tag_name in TAG_NAMES:
+    tags = [ContentTag(tag_name=tag_name, id=next(uuid_iter)) for tag_name in TAG_NAMES]
+    _insert_rows(ContentTag, tags)
+
+    tag_ids = [tag.id for tag in tags]
+    tag_ids_generated.extend(tag_ids)
+    generated_ids[ContentTag].extend(tag_ids)
+
 
-        tag = ContentTag.objects.create(tag_name=tag_name, id=uuid.uuid4().hex)
-        tags_generated.append(tag)
-        generated_objects.add(tag)
+# lang_id -> Language (or None if unknown to le_utils), the same few languages are
+# looked up for every node. Cleared for each run, as the database may have changed.
+_lang_cache = {}
 
 
 def get_or_generate_language(lang_id):
+    try:
+        return _lang_cache[lang_id]
+    except KeyError:
+        lang = _lang_cache[lang_id] = _get_or_generate_language(lang_id)
+        return lang
+
+
+def _get_or_generate_language(lang_id):
     try:
         return Language.objects.get(id=lang_id)
 
@@ -159,64 +407,38 @@ def get_or_generate_language(lang_id):
             lang_direction=languages.getlang_direction(lang_id),
         )
 
-        generated_objects.add(new_lang)
+        generated_ids[Language].append(new_lang.pk)
 
         return new_lang
 
 
 def generate_assessmentmetadata(node):
     number_of_assessments = random.randint(10, 35)
-    assessment_item_ids = [str(uuid.uuid4().hex) for _ in range(number_of_assessments)]
+    assessment_item_ids = bulk_hex_uuids(number_of_assessments)
 
     random_criteria = random.choice(mastery_criteria.MASTERYCRITERIALIST)
 
-    mapper = {
-        mastery_criteria.DO_ALL: {
-            "type": random_criteria,
-            "n": number_of_assessments,
-            "m": number_of_assessments,
-        },
-        mastery_criteria.NUM_CORRECT_IN_A_ROW_10: {
-            "type": random_criteria,
-            "n": 10,
-            "m": 10,
-        },
-        mastery_criteria.NUM_CORRECT_IN_A_ROW_2: {
-            "type": random_criteria,
-            "n": 2,
-            "m": 2,
-        },
-        mastery_criteria.NUM_CORRECT_IN_A_ROW_3: {
-            "type": random_criteria,
-            "n": 3,
-            "m": 3,
-        },
-        mastery_criteria.NUM_CORRECT_IN_A_ROW_5: {
-            "type": random_criteria,
-            "n": 5,
-            "m": 5,
-        },
-        mastery_criteria.M_OF_N: {
-            "type": random_criteria,
-            "n": random.randint(5, 7),
-            "m": random.randint(1, 3),
-        },
-    }
-
-    meta_data = AssessmentMetaData.objects.create(
-        id=uuid.uuid4().hex,
+    if random_criteria == mastery_criteria.M_OF_N:
+        n, m = random.randint(5, 7), random.randint(1, 3)
+    elif random_criteria == mastery_criteria.DO_ALL:
+        n = m = number_of_assessments
+    else:
+        n = m = NUM_CORRECT_IN_A_ROW[random_criteria]
+
+    meta_data = AssessmentMetaData(
+        id=next(uuid_iter),
         contentnode=node,
         assessment_item_ids=assessment_item_ids,
         number_of_assessments=number_of_assessments,
-        mastery_model=mapper[random_criteria],
+        mastery_model={"type": random_criteria, "n": n, "m": m},
         randomize=random.choice([True, False]),
         is_manipulable=random.choice([True, False]),
     )
-    generated_objects.add(meta_data)
+    assessment_buf.append(meta_data)
     return meta_data
 
 
-def generate_channel(name, root_node, channel_id):
+def generate_channel(name, root_node, channel_id, total_resource_count=0):
 
     channel = ChannelMetadata.objects.create(
         id=channel_id,
@@ -225,6 +447,7 @@ def generate_channel(name, root_node, channel_id):
         author=DEVELOPER_NAME,
         min_schema_version=MIN_SCHEMA_VERSION,
         root=root_node,
+        total_resource_count=total_resource_count,
     )
 
     return channel
@@ -232,40 +455,16 @@ def generate_channel(name, root_node, channel_id):
 
 def generate_localfile(file_preset):
 
-    # precalculated by taking the average file_size of actual existing localfiles
-    # instead of just random generated sizes, these are more relvant to the corresponding extension
-    extension_to_file_size = {
-        file_formats.MP4: 5933249,
-        file_formats.WEBM: None,
-        file_formats.VTT: 1242,
-        file_formats.PDF: 6655360,
-        file_formats.EPUB: 13291472,
-        file_formats.MP3: 2102685,
-        file_formats.JPG: 5604683,
-        file_formats.JPEG: 30433803,
-        file_formats.PNG: 609113,
-        file_formats.GIF: None,
-        file_formats.JSON: 3529,
-        file_formats.SVG: None,
-        file_formats.GRAPHIE: None,
-        file_formats.PERSEUS: 131841,
-        file_formats.H5P: 10699889,
-        file_formats.ZIM: None,
-        file_formats.HTML5: 1315774,
-    }
-
-    extensions_choices = format_prestets_data[file_preset].allowed_formats
-
-    extension_to_use = random.choice(extensions_choices)
-
-    new_localfile = LocalFile.objects.create(
-        id=uuid.uuid4().hex,
+    extension_to_use = random.choice(PRESET_FORMATS[file_preset])
+
+    new_localfile = LocalFile(
+        id=next(uuid_iter),
         extension=extension_to_use,
         available=True,
-        file_size=extension_to_file_size[extension_to_use],
+        file_size=EXTENSION_TO_FILE_SIZE[extension_to_use],
     )
 
-    generated_objects.add(new_localfile)
+    localfile_buf.append(new_localfile)
     return new_localfile
 
 
@@ -281,25 +480,29 @@ def generate_file(contentnode):
             main_file_preset_to_thumbnail_preset[main_preset]
         )
 
-        File.objects.create(
-            id=uuid.uuid4().hex,
-            local_file=generate_localfile(thumbnail_preset),
-            contentnode=contentnode,
-            lang=contentnode.lang,
-            supplementary=format_prestets_data[thumbnail_preset].supplementary,
-            thumbnail=format_prestets_data[thumbnail_preset].thumbnail,
-            preset=thumbnail_preset,
+        file_buf.append(
+            File(
+                id=next(uuid_iter),
+                local_file=generate_localfile(thumbnail_preset),
+                contentnode=contentnode,
+                lang=contentnode.lang,
+                supplementary=PRESET_SUPPLEMENTARY[thumbnail_preset],
+                thumbnail=PRESET_THUMBNAIL[thumbnail_preset],
+                preset=thumbnail_preset,
+            )
         )
 
     # generating the main_preset file (most probably a renderable resource)
-    File.objects.create(
-        id=uuid.uuid4().hex,
-        local_file=generate_localfile(main_preset),
-        contentnode=contentnode,
-        lang=contentnode.lang,
-        supplementary=format_prestets_data[main_preset].supplementary,
-        thumbnail=format_prestets_data[main_preset].thumbnail,
-        preset=main_preset,
+    file_buf.append(
+        File(
+            id=next(uuid_iter),
+            local_file=generate_localfile(main_preset),
+            contentnode=contentnode,
+            lang=contentnode.lang,
+            supplementary=PRESET_SUPPLEMENTARY[main_preset],
+            thumbnail=PRESET_THUMBNAIL[main_preset],
+            preset=main_preset,
+        )
     )
 
 
@@ -311,37 +514,13 @@ def generate_one_contentNode(
     parent=None,
     available=True,
     lang_id="en",
-    node_tags=[],
 ):
 
-    kind_to_learninactivity = {
-        content_kinds.TOPIC: "",
-        content_kinds.SLIDESHOW: "",
-        content_kinds.DOCUMENT: "{},{}".format(
-            learning_activities.READ, learning_activities.REFLECT
-        ),
-        content_kinds.VIDEO: "{},{}".format(
-            learning_activities.WATCH, learning_activities.REFLECT
-        ),
-        content_kinds.HTML5: "{},{}".format(
-            learning_activities.EXPLORE, learning_activities.REFLECT
-        ),
-        content_kinds.AUDIO: "{},{}".format(
-            learning_activities.LISTEN, learning_activities.REFLECT
-        ),
-        content_kinds.EXERCISE: "{},{}".format(
-            learning_activities.PRACTICE, learning_activities.REFLECT
-        ),
-        content_kinds.H5P: "{}.{}".format(
-            learning_activities.EXPLORE, learning_activities.REFLECT
-        ),
-    }
-
-    new_node = ContentNode.objects.create(
-        id=uuid.uuid4().hex,
+    new_node = ContentNode(
+        id=next(uuid_iter),
         parent=parent,
         channel_id=channel_id,
-        content_id=uuid.uuid4().hex,
+        content_id=next(uuid_iter),
         kind=kind,
         title=title,
         lang=get_or_generate_language(lang_id),
@@ -351,15 +530,19 @@ def generate_one_contentNode(
         license_owner=LICENSE_OWNER,
         author=DEVELOPER_NAME,
         available=available,
-        learning_activities=kind_to_learninactivity[kind],
-        categories=",".join(set(choices(SUBJECTSLIST, k=random.randint(1, 10)))),
-        learner_needs=",".join(set(choices(NEEDSLIST, k=random.randint(1, 5)))),
-        grade_levels=",".join(set(choices(LEVELSLIST, k=random.randint(1, 2)))),
+        learning_activities=KIND_TO_LEARNING_ACTIVITIES[kind],
+        categories=sample_labels(SUBJECTSLIST, 10),
+        learner_needs=sample_labels(NEEDSLIST, 5),
+        grade_levels=sample_labels(LEVELSLIST, 2),
     )
 
-    if node_tags:
-        new_node.tags.add(*node_tags)
-        new_node.save()
+    node_buf.append(new_node)
+
+    if kind != content_kinds.TOPIC:
+        stats = channel_stats[channel_id]
+        stats["resource_count"] += 1
+        if new_node.lang_id:
+            stats["lang_ids"].add(new_node.lang_id)
 
     # generate related File object for this node
     generate_file(new_node)
@@ -387,44 +570,100 @@ def generate_leaf(
     channel_id,
     description="",
 ):
-    return generate_one_contentNode(
+    leaf = generate_one_contentNode(
         kind=resource_kind,
         title="{} resource".format(resource_kind),
         channel_id=channel_id,
         parent=parent,
         description=description,
-        node_tags=random.sample(tags_generated, random.randint(1, 5)),
     )
 
+    # only resources are tagged
+    tag_links.extend(
+        (leaf.id, tag_id)
+        for tag_id in random.sample(tag_ids_generated, random.randint(1, 5))
+    )
 
-def recurse_and_generate(channel_id, parent, levels, n_children, resources_kind):
-    children = []
-    for i in range(n_children):
-        if levels == 0:
-            node = generate_leaf(
-                parent=parent,
-                channel_id=channel_id,
-                resource_kind=resources_kind
-                if resources_kind
-                else random.choice(ALL_RESOURCES_KINDS),
-            )
-        else:
-            node = generate_topic(
-                parent=parent,
-                channel_id=channel_id,
-                title="Level_{} Topic_{}".format(levels, i + 1),
-            )
-            node.children.add(
-                *recurse_and_generate(
+    return leaf
+
+
+def generate_tree(channel_id, root_node, levels, n_children, resources_kind):
+    """
+    Generates the descendants of root_node breadth first, with an explicit queue
+    rather than recursion: n_children topics per node for each level, then
+    n_children resources under each topic of the last level.
+    """
+    queue = deque([(root_node, levels)])
+    while queue:
+        parent, levels_left = queue.popleft()
+        for i in range(n_children):
+            if levels_left == 0:
+                generate_leaf(
+                    parent=parent,
                     channel_id=channel_id,
+                    resource_kind=resources_kind
+                    if resources_kind
+                    else random.choice(ALL_RESOURCES_KINDS),
+                )
+            else:
+                node = generate_topic(
                     parent=parent,
-                    levels=levels - 1,
-                    n_children=n_children,
-                    resources_kind=resources_kind,
+                    channel_id=channel_id,
+                    title="Level_{} Topic_{}".format(levels_left, i + 1),
                 )
-            )
-        children.append(node)
-    return children
+                queue.append((node, levels_left - 1))
+
+
+def generate_channel_tree(c, seed, levels, n_children, resources_kind):
+    """
+    Generates the unsaved instances of a channel tree without querying the database,
+    so that it can run in a forked worker process.
+
+    Returns the root node, the contents of the buffers, and the channel stats.
+    """
+    global uuid_iter
+
+    # a forked worker would otherwise hand out the ids left in its parent's block
+    uuid_iter = hex_uuids()
+    random.seed(seed)
+
+    channel_id = next(uuid_iter)
+
+    root_node = generate_topic(
+        title="Root Node of Channel_{}".format(c + 1),
+        channel_id=channel_id,
+        description="First Node of channel tree",
+    )
+
+    generate_tree(
+        channel_id=channel_id,
+        root_node=root_node,
+        levels=levels,
+        n_children=n_children,
+        resources_kind=resources_kind,
+    )
+
+    buffers = [list(buf) for buf in BUFFERS]
+    for buf in BUFFERS:
+        del buf[:]
+
+    return root_node, buffers, channel_stats.pop(channel_id)
+
+
+def _fork_executor(max_workers):
+    """
+    Returns a process pool whose workers are forked from this process, and so
+    inherit its Django setup and generation state, or None if we can't fork.
+    """
+    if not hasattr(os, "fork"):
+        return None
+    try:
+        return futures.ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("fork")
+        )
+    except (AttributeError, TypeError):
+        # Python versions without start methods always fork on POSIX
+        return futures.ProcessPoolExecutor(max_workers=max_workers)
 
 
 def generate_channels(n_channels=1, levels=2, n_children=3, resources_kind=None):
@@ -437,43 +676,59 @@ def generate_channels(n_channels=1, levels=2, n_children=3, resources_kind=None)
         )
     )
 
+    _lang_cache.clear()
+
     generate_some_tags()
 
-    for c in range(n_channels):
+    # workers can't query the database, so look up the (default) node language now
+    get_or_generate_language("en")
 
-        channel_id = uuid.uuid4().hex
+    # each channel gets a seed of its own, so the generated data is the same whether
+    # or not the channels are generated in parallel
+    seeds = [random.getrandbits(32) for _ in range(n_channels)]
+    random_state = random.getstate()
 
-        root_node = generate_topic(
-            title="Root Node of Channel_{}".format(c + 1),
-            channel_id=channel_id,
-            description="First Node of channel tree",
-        )
+    tree_args = (
+        range(n_channels),
+        seeds,
+        [levels] * n_channels,
+        [n_children] * n_channels,
+        [resources_kind] * n_channels,
+    )
+
+    executor = (
+        _fork_executor(min(n_channels, multiprocessing.cpu_count()))
+        if n_channels > 1
+        else None
+    )
+    if executor is None:
+        trees = list(map(generate_channel_tree, *tree_args))
+    else:
+        with executor:
+            trees = list(executor.map(generate_channel_tree, *tree_args))
+
+    random.setstate(random_state)
+
+    # every channel is a tree of its own, they are all inserted at once below
+    next_tree_id = ContentNode.objects._get_next_tree_id()
+    for tree_id, (root_node, buffers, stats) in enumerate(trees, start=next_tree_id):
+        # the root node is the first node of its tree's buffer
+        set_tree_fields(root_node, buffers[0][1:], tree_id)
+        for buf, tree_buf in zip(BUFFERS, buffers):
+            buf.extend(tree_buf)
+
+    flush_buffers()
+
+    for c, (root_node, _, stats) in enumerate(trees):
 
         channel = generate_channel(
             name="Testing Channel_{}".format(c + 1),
             root_node=root_node,
-            channel_id=channel_id,
-        )
-
-        root_node.children.add(
-            *recurse_and_generate(
-                channel_id=channel_id,
-                parent=root_node,
-                levels=levels,
-                n_children=n_children,
-                resources_kind=resources_kind,
-            )
+            channel_id=root_node.channel_id,
+            total_resource_count=stats["resource_count"],
         )
 
-        channel_contents = ContentNode.objects.filter(
-            channel_id=channel_id,
-        ).exclude(kind=content_kinds.TOPIC)
-
-        channel.total_resource_count = channel_contents.count()
-
-        for each_content in channel_contents:
-            if each_content.lang:
-                channel.included_languages.add(each_content.lang)
+        channel.included_languages.add(*stats["lang_ids"])
 
         generated_channels.append(channel)
 
@@ -527,6 +782,12 @@ class Command(BaseCommand):
 
         parser.add_argument("--resources_kind", type=str, choices=ALL_RESOURCES_KINDS)
 
+        parser.add_argument(
+            "--fast",
+            action="store_true",
+            help="turn off sqlite durability (synchronous, journal) while generating",
+        )
+
     def handle(self, *args, **options):
 
         seed_n = options["seed"]
@@ -537,6 +798,7 @@ class Command(BaseCommand):
         required_levels = options["levels"]
         n_children = options["children"]
         resources_kind = options["resources_kind"]
+        fast = options["fast"]
 
         # Set the random seed so that all operations will be randomized predictably
         random.seed(seed_n)
@@ -549,12 +811,13 @@ class Command(BaseCommand):
 
             switch_to_memory()
 
-            channels_generated = generate_channels(
-                n_channels=n_channels,
-                levels=required_levels,
-                n_children=n_children,
-                resources_kind=resources_kind,
-            )
+            with fast_sqlite_writes(fast), transaction.atomic():
+                channels_generated = generate_channels(
+                    n_channels=n_channels,
+                    levels=required_levels,
+                    n_children=n_children,
+                    resources_kind=resources_kind,
+                )
 
             logger.info(
                 "\ndumping and creating fixtures for facilities and its data... \n"
@@ -569,21 +832,18 @@ class Command(BaseCommand):
             )
 
             # although we are in memory (data will be cleared by default) but just in case we didn't switch to memory
-            [
+            for each_channel in channels_generated:
                 each_channel.delete_content_tree_and_files()
-                for each_channel in channels_generated
-            ]
 
-            [
-                each_generated_object.delete()
-                for each_generated_object in generated_objects
-            ]
+            delete_generated_objects()
 
         else:
-            generate_channels(
-                n_channels=n_channels,
-                levels=required_levels,
-                n_children=n_children,
-                resources_kind=resources_kind,
-            )
+            # a single commit for the whole generation, rather than one per insert
+            with fast_sqlite_writes(fast), transaction.atomic():
+                generate_channels(
+                    n_channels=n_channels,
+                    levels=required_levels,
+                    n_children=n_children,
+                    resources_kind=resources_kind,
+                )
         logger.info("\n done \n")
@@ -1,6 +1,7 @@
 import requests
 from django.core.management import call_command
 from rest_framework import serializers
+from six import string_types
 from six import with_metaclass
 
 from kolibri.core.content.utils.channels import get_mounted_drive_by_id
@@ -8,6 +9,7 @@ from kolibri.core.content.utils.channels import read_channel_metadata_from_db_fi
 from kolibri.core.content.utils.paths import get_channel_lookup_url
 from kolibri.core.content.utils.paths import get_content_database_file_path
 from kolibri.core.content.utils.upgrade import diff_stats
+from kolibri.core.discovery.models import NETWORK_LOCATION_PEER_CACHE_KEY
 from kolibri.core.discovery.models import NetworkLocation
 from kolibri.core.discovery.utils.network.client import NetworkClient
 from kolibri.core.discovery.utils.network.errors import NetworkLocationNotFound
@@ -16,8 +18,11 @@ from kolibri.core.serializers import HexOnlyUUIDField
 from kolibri.core.tasks.decorators import register_task
 from kolibri.core.tasks.job import Priority
 from kolibri.core.tasks.permissions import CanManageContent
+from kolibri.core.tasks.utils import get_current_job
 from kolibri.core.tasks.validation import JobValidator
+from kolibri.core.utils.cache import process_cache
 from kolibri.utils import conf
+from kolibri.utils.file_transfer import Transfer
 
 
 QUEUE = "content"
@@ -121,8 +126,41 @@ def diskcontentimport(
     )
 
 
+# How long to cache a peer's network location, in seconds. Saving or deleting the
+# network location clears it sooner, but queryset updates do not.
+PEER_CACHE_TIMEOUT = 60
+
+
+class PeerField(serializers.PrimaryKeyRelatedField):
+    """
+    Caches looked up peers, so that repeatedly starting tasks for the same
+    peer, whether in a bulk request or across requests, does not query
+    the network location every time.
+    """
+
+    def to_internal_value(self, data):
+        if not isinstance(data, string_types):
+            return super(PeerField, self).to_internal_value(data)
+        cache_key = NETWORK_LOCATION_PEER_CACHE_KEY.format(data)
+        peer = process_cache.get(cache_key)
+        if peer is None:
+            peer = super(PeerField, self).to_internal_value(data)
+            process_cache.set(cache_key, peer, PEER_CACHE_TIMEOUT)
+        # Return a copy, as the validator updates the peer's base_url in place.
+        return dict(peer)
+
+
+def _resolve_peer_base_url(base_url, cache=None):
+    if cache is None:
+        return NetworkClient(address=base_url).base_url
+    key = ("base_url", base_url)
+    if key not in cache:
+        cache[key] = NetworkClient(address=base_url).base_url
+    return cache[key]
+
+
 class RemoteImportMixin(with_metaclass(serializers.SerializerMetaclass)):
-    peer = serializers.PrimaryKeyRelatedField(
+    peer = PeerField(
         required=False, queryset=NetworkLocation.objects.all().values("base_url", "id")
     )
 
@@ -136,7 +174,9 @@ class RemoteImportMixin(with_metaclass(serializers.SerializerMetaclass)):
             },
         )
         try:
-            baseurl = NetworkClient(address=peer["base_url"]).base_url
+            baseurl = _resolve_peer_base_url(
+                peer["base_url"], cache=self.context.get("cache")
+            )
             peer["base_url"] = baseurl
         except NetworkLocationNotFound:
             raise ResourceGoneError()
@@ -363,23 +403,15 @@ def diskchannelimport(
     )
 
 
-class RemoteChannelDiffStatsValidator(RemoteChannelImportValidator):
-    def validate(self, data):
-        job_data = super(RemoteChannelDiffStatsValidator, self).validate(data)
-        # get channel version metadata
-        url = get_channel_lookup_url(
-            baseurl=job_data["kwargs"]["baseurl"], identifier=data["channel_id"]
-        )
-        resp = requests.get(url)
-        channel_metadata = resp.json()
-        job_data["extra_metadata"]["new_channel_version"] = channel_metadata[0][
-            "version"
-        ]
-        return job_data
+def _save_new_channel_version(version):
+    job = get_current_job()
+    if job:
+        job.extra_metadata["new_channel_version"] = version
+        job.save_meta()
 
 
 @register_task(
-    validator=RemoteChannelDiffStatsValidator,
+    validator=RemoteChannelImportValidator,
     track_progress=False,
     cancellable=True,
     permission_classes=[CanManageContent],
@@ -390,6 +422,11 @@ def remotechanneldiffstats(
     baseurl=None,
     peer_id=None,
 ):
+    # Look up the new channel version here rather than in the validator,
+    # so that the request enqueueing this task does not wait on the peer.
+    url = get_channel_lookup_url(baseurl=baseurl, identifier=channel_id)
+    channel_metadata = requests.get(url, timeout=Transfer.DEFAULT_TIMEOUT).json()
+    _save_new_channel_version(channel_metadata[0]["version"])
     return diff_stats(
         channel_id,
         "network",
@@ -397,20 +434,8 @@ def remotechanneldiffstats(
     )
 
 
-class LocalChannelDiffStatsValidator(LocalChannelImportValidator, LocalMixin):
-    def validate(self, data):
-        job_data = super(LocalChannelDiffStatsValidator, self).validate(data)
-        # get channel version metadata
-        drive = get_mounted_drive_by_id(data["drive_id"])
-        channel_metadata = read_channel_metadata_from_db_file(
-            get_content_database_file_path(data["channel_id"], drive.datafolder)
-        )
-        job_data["extra_metadata"]["new_channel_version"] = channel_metadata["version"]
-        return job_data
-
-
 @register_task(
-    validator=LocalChannelDiffStatsValidator,
+    validator=LocalChannelImportValidator,
     track_progress=False,
     cancellable=True,
     permission_classes=[CanManageContent],
@@ -420,6 +445,11 @@ def localchanneldiffstats(
     channel_id,
     drive_id,
 ):
+    drive = get_mounted_drive_by_id(drive_id)
+    channel_metadata = read_channel_metadata_from_db_file(
+        get_content_database_file_path(channel_id, drive.datafolder)
+    )
+    _save_new_channel_version(channel_metadata["version"])
     return diff_stats(
         channel_id,
         "disk",
@@ -58,3 +58,32 @@ class EnumerateChannelTestCase(TestCase):
         # Make sure that the corrupted database file is not going to be listed
         self.assertTrue("6199dde695db4ee4ab392222d5af1e5c" not in channels)
         os.remove(db_file)  # Remove database file for future tests
+
+    @patch("kolibri.core.content.utils.channels.read_channel_metadata_from_db_file")
+    def test_channel_metadata_reread_only_when_file_changes(self, read_mock):
+        datafolder = tempfile.mkdtemp()
+        db_file = os.path.join(
+            get_content_database_dir_path(datafolder),
+            "6199dde695db4ee4ab392222d5af1e5c.sqlite3",
+        )
+        with open(db_file, "w") as f:
+            f.write("test database file")
+        read_mock.return_value = {
+            "id": "6199dde695db4ee4ab392222d5af1e5c",
+            "name": "test",
+            "description": "",
+            "thumbnail": "",
+            "version": 1,
+            "root_id": "6199dde695db4ee4ab392222d5af1e5c",
+            "author": "",
+        }
+
+        get_channels_for_data_folder(datafolder)
+        get_channels_for_data_folder(datafolder)
+        self.assertEqual(read_mock.call_count, 1)
+
+        with open(db_file, "a") as f:
+            f.write("updated")
+        get_channels_for_data_folder(datafolder)
+        self.assertEqual(read_mock.call_count, 2)
+        os.remove(db_file)  # Remove database file for future tests
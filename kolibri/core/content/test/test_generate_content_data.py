@@ -0,0 +1,74 @@
+from django.test import TestCase
+from le_utils.constants import content_kinds
+
+from kolibri.core.content.management.commands import generate_content_data
+from kolibri.core.content.models import ContentNode
+
+
+class GenerateContentDataTestCase(TestCase):
+    """
+    The generator fills in the mptt fields itself and inserts the rows in bulk,
+    possibly from a pool of forked workers, so check that the channels it
+    generates are still well formed trees.
+    """
+
+    def setUp(self):
+        self.channels = generate_content_data.generate_channels(
+            n_channels=2, levels=1, n_children=2
+        )
+
+    def tearDown(self):
+        generate_content_data.delete_generated_objects()
+        del generate_content_data.tag_ids_generated[:]
+
+    def test_generates_channels(self):
+        self.assertEqual(len(self.channels), 2)
+        self.assertEqual(len(set(channel.id for channel in self.channels)), 2)
+
+    def test_descendants_match_channel_nodes(self):
+        for channel in self.channels:
+            nodes = ContentNode.objects.filter(channel_id=channel.id)
+            # the root, 2 topics and 2 resources in each topic
+            self.assertEqual(nodes.count(), 7)
+            root = ContentNode.objects.get(id=channel.root_id)
+            self.assertIsNone(root.parent_id)
+            self.assertEqual(root.get_descendants().count(), nodes.count() - 1)
+
+    def test_tree_fields_nest(self):
+        for channel in self.channels:
+            nodes = {
+                node.id: node
+                for node in ContentNode.objects.filter(channel_id=channel.id)
+            }
+            for node in nodes.values():
+                if node.parent_id is None:
+                    continue
+                parent = nodes[node.parent_id]
+                self.assertEqual(node.tree_id, parent.tree_id)
+                self.assertEqual(node.level, parent.level + 1)
+                self.assertTrue(parent.lft < node.lft < node.rght < parent.rght)
+
+        self.assertNotEqual(
+            ContentNode.objects.get(id=self.channels[0].root_id).tree_id,
+            ContentNode.objects.get(id=self.channels[1].root_id).tree_id,
+        )
+
+    def test_channel_resource_count_and_languages(self):
+        for channel in self.channels:
+            resources = ContentNode.objects.filter(channel_id=channel.id).exclude(
+                kind=content_kinds.TOPIC
+            )
+            self.assertEqual(channel.total_resource_count, 4)
+            self.assertEqual(resources.count(), channel.total_resource_count)
+            self.assertEqual(
+                set(channel.included_languages.values_list("id", flat=True)),
+                set(resources.values_list("lang_id", flat=True)),
+            )
+
+    def test_resources_are_tagged(self):
+        for channel in self.channels:
+            for node in ContentNode.objects.filter(channel_id=channel.id):
+                if node.kind == content_kinds.TOPIC:
+                    self.assertFalse(node.tags.exists())
+                else:
+                    self.assertTrue(node.tags.exists())
@@ -11,7 +11,10 @@ from kolibri.core.content.models import ContentNode
 from kolibri.core.content.tasks import ChannelResourcesValidator
 from kolibri.core.content.tasks import ChannelValidator
 from kolibri.core.content.tasks import LocalChannelImportValidator
+from kolibri.core.content.tasks import localchanneldiffstats
 from kolibri.core.content.tasks import RemoteChannelImportValidator
+from kolibri.core.content.tasks import remotechanneldiffstats
+from kolibri.core.discovery.models import DynamicNetworkLocation
 from kolibri.core.discovery.models import NetworkLocation
 from kolibri.utils import conf
 
@@ -166,6 +169,80 @@ class ValidateRemoteImportTaskTestCase(TestCase):
             },
         )
 
+    @mock.patch("kolibri.core.content.tasks.NetworkClient")
+    def test_peer_lookups_shared_through_cache(self, network_client_mock):
+        network_client_mock.return_value.base_url = self.network_location.base_url
+        cache = {}
+
+        for _ in range(3):
+            channel_id = uuid.uuid4().hex
+            validator = RemoteChannelImportValidator(
+                data={
+                    "type": "kolibri.core.content.tasks.remotechannelimport",
+                    "channel_id": channel_id,
+                    "channel_name": "test",
+                    "peer": self.network_location.id,
+                },
+                context={"cache": cache},
+            )
+            validator.is_valid(raise_exception=True)
+            self.assertEqual(
+                validator.validated_data["kwargs"],
+                {
+                    "baseurl": self.network_location.base_url,
+                    "peer_id": self.network_location.id,
+                },
+            )
+
+        # Was the peer's address only resolved once for all the tasks?
+        network_client_mock.assert_called_once_with(
+            address=self.network_location.base_url
+        )
+
+    @mock.patch("kolibri.core.content.tasks.NetworkClient")
+    def test_cached_peer_updated_on_save(self, network_client_mock):
+        network_location = NetworkLocation.objects.create(base_url="http://old.org")
+
+        def validate():
+            RemoteChannelImportValidator(
+                data={
+                    "type": "kolibri.core.content.tasks.remotechannelimport",
+                    "channel_id": uuid.uuid4().hex,
+                    "channel_name": "test",
+                    "peer": network_location.id,
+                }
+            ).is_valid(raise_exception=True)
+
+        validate()
+        network_client_mock.assert_called_with(address="http://old.org")
+
+        network_location.base_url = "http://new.org"
+        network_location.save()
+
+        validate()
+        network_client_mock.assert_called_with(address="http://new.org")
+
+    @mock.patch("kolibri.core.content.tasks.NetworkClient")
+    def test_cached_peer_cleared_on_queryset_delete(self, network_client_mock):
+        network_location = DynamicNetworkLocation.objects.create(
+            id="a" * 32, instance_id="a" * 32, base_url="http://old.org"
+        )
+        validator_data = {
+            "type": "kolibri.core.content.tasks.remotechannelimport",
+            "channel_id": uuid.uuid4().hex,
+            "channel_name": "test",
+            "peer": network_location.id,
+        }
+
+        RemoteChannelImportValidator(data=validator_data).is_valid(raise_exception=True)
+
+        DynamicNetworkLocation.objects.filter(pk=network_location.id).delete()
+
+        with self.assertRaises(serializers.ValidationError):
+            RemoteChannelImportValidator(data=validator_data).is_valid(
+                raise_exception=True
+            )
+
     @mock.patch("kolibri.core.content.tasks.NetworkClient")
     def test_correct_peer_id(self, network_client_mock):
         channel_id = uuid.uuid4().hex
@@ -252,3 +329,71 @@ class ValidateLocalImportTaskTestCase(TestCase):
                 "kwargs": {},
             },
         )
+
+
+@mock.patch("kolibri.core.content.tasks.diff_stats")
+@mock.patch("kolibri.core.content.tasks.get_current_job")
+class ChannelDiffStatsTaskTestCase(TestCase):
+    def setUp(self):
+        self.channel_id = uuid.uuid4().hex
+        self.job = mock.MagicMock(extra_metadata={})
+
+    @mock.patch("kolibri.core.content.tasks.requests")
+    def test_remote_diff_stats_saves_new_channel_version(
+        self, requests_mock, get_current_job_mock, diff_stats_mock
+    ):
+        get_current_job_mock.return_value = self.job
+        requests_mock.get.return_value.json.return_value = [{"version": 7}]
+
+        result = remotechanneldiffstats(
+            self.channel_id, baseurl="https://kolibri.example.com"
+        )
+
+        requests_mock.get.assert_called_once()
+        self.assertIsNotNone(requests_mock.get.call_args[1].get("timeout"))
+        self.assertEqual(self.job.extra_metadata["new_channel_version"], 7)
+        self.job.save_meta.assert_called_once_with()
+        diff_stats_mock.assert_called_once_with(
+            self.channel_id, "network", baseurl="https://kolibri.example.com"
+        )
+        self.assertEqual(result, diff_stats_mock.return_value)
+
+    @mock.patch("kolibri.core.content.tasks.read_channel_metadata_from_db_file")
+    @mock.patch("kolibri.core.content.tasks.get_mounted_drive_by_id")
+    def test_local_diff_stats_saves_new_channel_version(
+        self,
+        get_mounted_drive_by_id_mock,
+        read_channel_metadata_mock,
+        get_current_job_mock,
+        diff_stats_mock,
+    ):
+        get_current_job_mock.return_value = self.job
+        get_mounted_drive_by_id_mock.return_value.datafolder = "kolibri"
+        read_channel_metadata_mock.return_value = {"version": 3}
+
+        result = localchanneldiffstats(self.channel_id, "test_id")
+
+        read_channel_metadata_mock.assert_called_once()
+        self.assertEqual(self.job.extra_metadata["new_channel_version"], 3)
+        self.job.save_meta.assert_called_once_with()
+        diff_stats_mock.assert_called_once_with(
+            self.channel_id, "disk", drive_id="test_id"
+        )
+        self.assertEqual(result, diff_stats_mock.return_value)
+
+    @mock.patch("kolibri.core.content.tasks.read_channel_metadata_from_db_file")
+    @mock.patch("kolibri.core.content.tasks.get_mounted_drive_by_id")
+    def test_diff_stats_outside_of_a_job(
+        self,
+        get_mounted_drive_by_id_mock,
+        read_channel_metadata_mock,
+        get_current_job_mock,
+        diff_stats_mock,
+    ):
+        get_current_job_mock.return_value = None
+        get_mounted_drive_by_id_mock.return_value.datafolder = "kolibri"
+        read_channel_metadata_mock.return_value = {"version": 3}
+
+        result = localchanneldiffstats(self.channel_id, "test_id")
+
+        self.assertEqual(result, diff_stats_mock.return_value)
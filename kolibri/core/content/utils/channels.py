@@ -105,13 +105,30 @@ def read_channel_metadata_from_db_file(channeldbpath):
     return source_channel_metadata
 
 
+# Channel metadata read from channel database files, keyed by file path, along
+# with the modification time and size of the file when it was read. Listing the
+# drives reads every channel database on them, which is slow on removable media,
+# so the metadata is only read again when the file has changed.
+_channel_metadata_cache = {}
+
+
+def _read_channel_metadata_from_db_file_cached(channeldbpath):
+    stat = os.stat(channeldbpath)
+    file_key = (stat.st_mtime, stat.st_size)
+    cached = _channel_metadata_cache.get(channeldbpath)
+    if cached is None or cached[0] != file_key:
+        cached = (file_key, read_channel_metadata_from_db_file(channeldbpath))
+        _channel_metadata_cache[channeldbpath] = cached
+    return cached[1]
+
+
 def get_channels_for_data_folder(datafolder):
     channels = []
     for path in enumerate_content_database_file_paths(
         get_content_database_dir_path(datafolder)
     ):
         try:
-            channel = read_channel_metadata_from_db_file(path)
+            channel = _read_channel_metadata_from_db_file_cached(path)
         except DatabaseError:
             logger.warning(
                 "Tried to import channel from database file {}, but the file was corrupted.".format(
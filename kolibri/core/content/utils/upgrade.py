@@ -65,42 +65,9 @@ def diff_stats(channel_id, method, drive_id=None, baseurl=None):
                 "importchannel", "disk", channel_id, drive.datafolder, no_upgrade=True
             )
 
-        # create all fields/tables at the annotated destination db, based on the current schema version
-        bridge = Bridge(
-            sqlite_file_path=destination_path, schema_version=CURRENT_SCHEMA_VERSION
+        stats, resources_to_be_deleted_count = _diff_annotated_channel_database(
+            channel_id, source_path, destination_path
         )
-        bridge.Base.metadata.create_all(bridge.engine)
-
-        # initialize import manager based on annotated destination path, pulling from source db path
-        import_manager = channel_import.initialize_import_manager(
-            channel_id,
-            cancel_check=False,
-            source=source_path,
-            destination=destination_path,
-        )
-
-        # import channel data from source db path
-        import_manager.import_channel_data()
-        import_manager.end()
-
-        # annotate file availability on destination db
-        annotation.set_local_file_availability_from_disk(destination=destination_path)
-        # get the diff count between whats on the default db and the annotated db
-        (
-            new_resource_ids,
-            new_resource_content_ids,
-            new_resource_total_size,
-        ) = get_new_resources_available_for_import(destination_path, channel_id)
-        # get the count for leaf nodes which are in the default db, but not in the annotated db
-        resources_to_be_deleted_count = count_removed_resources(
-            destination_path, channel_id
-        )
-        # get the ids of leaf nodes which are now incomplete due to missing local files
-        (
-            updated_resource_ids,
-            updated_resource_content_ids,
-            updated_resource_total_size,
-        ) = get_automatically_updated_resources(destination_path, channel_id)
         # remove the annotated database
         try:
             os.remove(destination_path)
@@ -113,12 +80,14 @@ def diff_stats(channel_id, method, drive_id=None, baseurl=None):
         # annotate job metadata with diff stats
         job = get_current_job()
         if job:
-            job.extra_metadata["new_resources_count"] = len(new_resource_content_ids)
+            job.extra_metadata["new_resources_count"] = len(
+                stats["new_resource_content_ids"]
+            )
             job.extra_metadata[
                 "deleted_resources_count"
             ] = resources_to_be_deleted_count
             job.extra_metadata["updated_resources_count"] = len(
-                updated_resource_content_ids
+                stats["updated_resource_content_ids"]
             )
             job.save_meta()
 
@@ -126,14 +95,7 @@ def diff_stats(channel_id, method, drive_id=None, baseurl=None):
 
         process_cache.set(
             CACHE_KEY,
-            {
-                "new_resource_ids": new_resource_ids,
-                "new_resource_content_ids": new_resource_content_ids,
-                "new_resource_total_size": new_resource_total_size,
-                "updated_resource_ids": updated_resource_ids,
-                "updated_resource_content_ids": updated_resource_content_ids,
-                "updated_resource_total_size": updated_resource_total_size,
-            },
+            stats,
             # Should persist until explicitly cleared (at content import)
             # or until server restart.
             None,
@@ -148,15 +110,79 @@ def diff_stats(channel_id, method, drive_id=None, baseurl=None):
         raise
 
 
+def _diff_annotated_channel_database(channel_id, source_path, destination_path):
+    """
+    Import the upgraded channel db into the annotated db, annotate its local file
+    availability, and compare it with the default db.
+    Returns the diff stats to cache and the count of resources to be deleted.
+    """
+    # create all fields/tables at the annotated destination db, based on the current schema version
+    # (the bridge does this itself when given both a file path and a schema version)
+    bridge = Bridge(
+        sqlite_file_path=destination_path, schema_version=CURRENT_SCHEMA_VERSION
+    )
+    try:
+        # initialize import manager based on annotated destination path, pulling from source db path
+        import_manager = channel_import.initialize_import_manager(
+            channel_id,
+            cancel_check=False,
+            source=source_path,
+            destination=destination_path,
+        )
+
+        # import channel data from source db path
+        import_manager.import_channel_data()
+        import_manager.end()
+
+        # annotate file availability on destination db
+        annotation.set_local_file_availability_from_disk(destination=destination_path)
+        # share the bridge to the annotated db between all the diff passes below,
+        # rather than connecting to it and inferring its schema for each of them
+        # get the diff count between whats on the default db and the annotated db
+        (
+            new_resource_ids,
+            new_resource_content_ids,
+            new_resource_total_size,
+        ) = get_new_resources_available_for_import(
+            destination_path, channel_id, bridge=bridge
+        )
+        # get the count for leaf nodes which are in the default db, but not in the annotated db
+        resources_to_be_deleted_count = count_removed_resources(
+            destination_path, channel_id, bridge=bridge
+        )
+        # get the ids of leaf nodes which are now incomplete due to missing local files
+        (
+            updated_resource_ids,
+            updated_resource_content_ids,
+            updated_resource_total_size,
+        ) = get_automatically_updated_resources(
+            destination_path, channel_id, bridge=bridge
+        )
+    finally:
+        # always release the annotated db, so that it can be removed afterwards
+        bridge.end()
+
+    stats = {
+        "new_resource_ids": new_resource_ids,
+        "new_resource_content_ids": new_resource_content_ids,
+        "new_resource_total_size": new_resource_total_size,
+        "updated_resource_ids": updated_resource_ids,
+        "updated_resource_content_ids": updated_resource_content_ids,
+        "updated_resource_total_size": updated_resource_total_size,
+    }
+    return stats, resources_to_be_deleted_count
+
+
 batch_size = 1000
 
 
-def get_new_resources_available_for_import(destination, channel_id):
+def get_new_resources_available_for_import(destination, channel_id, bridge=None):
     """
     Queries the destination db to get leaf nodes.
     Subtract total number of leaf nodes by the count of leaf nodes on default db to get the number of new resources.
     """
-    bridge = Bridge(app_name=CONTENT_APP_NAME, sqlite_file_path=destination)
+    if bridge is None:
+        bridge = Bridge(app_name=CONTENT_APP_NAME, sqlite_file_path=destination)
     # SQL Alchemy reference to the content node table
     ContentNodeTable = bridge.get_table(ContentNode)
     # SQL Alchemy reference to the file table - a mapping from
@@ -351,13 +377,14 @@ def get_new_resources_available_for_import(destination, channel_id):
     )
 
 
-def count_removed_resources(destination, channel_id):
+def count_removed_resources(destination, channel_id, bridge=None):
     """
     Queries the destination db to get the leaf node content_ids.
     Subtract available leaf nodes count on default db by available
     leaf nodes based on destination db leaf node content_ids.
     """
-    bridge = Bridge(app_name=CONTENT_APP_NAME, sqlite_file_path=destination)
+    if bridge is None:
+        bridge = Bridge(app_name=CONTENT_APP_NAME, sqlite_file_path=destination)
     connection = bridge.get_connection()
     ContentNodeTable = bridge.get_table(ContentNode)
     resource_node_ids_statement = (
@@ -415,12 +442,13 @@ def count_removed_resources(destination, channel_id):
     )
 
 
-def get_automatically_updated_resources(destination, channel_id):
+def get_automatically_updated_resources(destination, channel_id, bridge=None):
     """
     Queries the destination db to get the leaf node ids, where local file objects are unavailable.
     Get the available node ids related to those missing file objects.
     """
-    bridge = Bridge(app_name=CONTENT_APP_NAME, sqlite_file_path=destination)
+    if bridge is None:
+        bridge = Bridge(app_name=CONTENT_APP_NAME, sqlite_file_path=destination)
     connection = bridge.get_connection()
     ContentNodeTable = bridge.get_table(ContentNode)
     # SQL Alchemy reference to the file table - a mapping from
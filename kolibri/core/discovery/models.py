@@ -3,11 +3,20 @@ from datetime import datetime
 
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 from django.utils import timezone
 
 from .utils.network.connections import check_connection_info
+from kolibri.core.utils.cache import process_cache
 from kolibri.deployment.default.sqlite_db_names import NETWORK_LOCATION
 
+# Cache key for the id and base_url of a network location, when looked up as the
+# peer for a task. Cleared whenever the network location is saved or deleted,
+# including by queryset deletes.
+NETWORK_LOCATION_PEER_CACHE_KEY = "network_location_peer_{}"
+
 
 def _filter_out_unsupported_fields(fields):
     return {k: v for (k, v) in fields.items() if NetworkLocation.has_field(k)}
@@ -128,6 +137,18 @@ class DynamicNetworkLocation(NetworkLocation):
             )
 
 
+# Signals are sent with the proxy model as the sender when saving or deleting
+# through it, so listen for all of them.
+@receiver(post_save, sender=NetworkLocation)
+@receiver(post_save, sender=StaticNetworkLocation)
+@receiver(post_save, sender=DynamicNetworkLocation)
+@receiver(post_delete, sender=NetworkLocation)
+@receiver(post_delete, sender=StaticNetworkLocation)
+@receiver(post_delete, sender=DynamicNetworkLocation)
+def clear_network_location_peer_cache(sender, instance, **kwargs):
+    process_cache.delete(NETWORK_LOCATION_PEER_CACHE_KEY.format(instance.id))
+
+
 class NetworkLocationRouter(object):
     """
     Determine how to route database calls for the Network Location models.
@@ -14,8 +14,7 @@ from kolibri.utils import conf
 def get_filepath(log_type, facility_id):
     facility = Facility.objects.get(id=facility_id)
     logs_dir = os.path.join(conf.KOLIBRI_HOME, "log_export")
-    if not os.path.isdir(logs_dir):
-        os.mkdir(logs_dir)
+    os.makedirs(logs_dir, exist_ok=True)
     filepath = os.path.join(
         logs_dir,
         CSV_EXPORT_FILENAMES[log_type].format(facility.name, facility.id[:4]),
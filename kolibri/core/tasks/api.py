@@ -1,6 +1,10 @@
+import hashlib
 import logging
+from operator import attrgetter
 
 from django.http.response import Http404
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import etag
 from rest_framework import decorators
 from rest_framework import serializers
 from rest_framework import viewsets
@@ -8,15 +12,59 @@ from rest_framework.exceptions import PermissionDenied
 from rest_framework.response import Response
 from six import string_types
 
+from kolibri.core.auth.permissions.general import _user_is_admin_for_own_facility
 from kolibri.core.tasks.exceptions import JobNotFound
 from kolibri.core.tasks.exceptions import JobNotRestartable
 from kolibri.core.tasks.job import State
 from kolibri.core.tasks.main import job_storage
 from kolibri.core.tasks.registry import TaskRegistry
+from kolibri.utils import conf
 
 
 logger = logging.getLogger(__name__)
 
+# Fetches all the job attributes used to build a task response in one call.
+_job_response_fields = attrgetter(
+    "state",
+    "percentage_progress",
+    "func",
+    "exception",
+    "traceback",
+    "job_id",
+    "cancellable",
+    "facility_id",
+    "extra_metadata",
+)
+
+_clearable_states = frozenset((State.FAILED, State.CANCELED, State.COMPLETED))
+
+
+def _jobs_list_etag(request, *args, **kwargs):
+    # The listed jobs only change when a job is added, updated or removed, so
+    # the job count and latest update time identify the response without
+    # reading any of the jobs. The jobs a user can see depend on their
+    # permissions, so everything the task permission classes check about the
+    # user is included too, so that a change in permissions is never hidden
+    # behind a 304.
+    from kolibri.core.device.utils import device_provisioned
+
+    user = request.user
+    last_modified = job_storage.get_jobs_last_modified(
+        queue=request.query_params.get("queue", None),
+        state=request.query_params.get("state", None),
+    )
+    return hashlib.md5(
+        "{}:{}:{}:{}:{}:{}:{}".format(
+            user.pk,
+            user.is_superuser,
+            user.can_manage_content,
+            _user_is_admin_for_own_facility(user),
+            getattr(user, "facility_id", None),
+            device_provisioned(),
+            last_modified,
+        ).encode("utf-8")
+    ).hexdigest()
+
 
 class TasksSerializer(serializers.Serializer):
     """
@@ -47,69 +95,143 @@ class TasksViewSet(viewsets.GenericViewSet):
 
         If `request.user` is authorized to initiate the `task` function, this returns
         a list of `request.data` otherwise raises `PermissionDenied`.
+
+        If more tasks are requested than the `MAX_BULK_TASKS` option allows then
+        `ValidationError` is raised before any of them are validated.
         """
         if isinstance(request.data, list):
             request_data_list = request.data
         else:
             request_data_list = [request.data]
 
-        validated_jobs = []
+        max_bulk_tasks = conf.OPTIONS["Tasks"]["MAX_BULK_TASKS"]
+        if len(request_data_list) > max_bulk_tasks:
+            raise serializers.ValidationError(
+                "Too many tasks requested, the maximum is {}".format(max_bulk_tasks)
+            )
 
-        for request_data in request_data_list:
-            # Make sure the task is registered
-            registered_task = TaskRegistry.validate_task(request_data.get("type"))
+        # Shared between validators so that lookups repeated across the tasks
+        # of a bulk request, e.g. of the same peer, are only done once.
+        validation_cache = {}
 
-            job = registered_task.validate_job_data(request.user, request_data)
+        return [
+            self._validate_job_data(request, request_data, validation_cache)
+            for request_data in request_data_list
+        ]
 
-            registered_task.check_job_permissions(request.user, job, self)
+    def _validate_job_data(self, request, request_data, validation_cache):
+        # Make sure the task is registered
+        registered_task = TaskRegistry.validate_task(request_data.get("type"))
+
+        job = registered_task.validate_job_data(
+            request.user, request_data, cache=validation_cache
+        )
 
-            validated_jobs.append((registered_task, job))
+        registered_task.check_job_permissions(request.user, job, self)
 
-        return validated_jobs
+        return registered_task, job
 
     def _job_to_response(self, job):
+        (
+            state,
+            percentage,
+            func,
+            exception,
+            traceback,
+            job_id,
+            cancellable,
+            facility_id,
+            extra_metadata,
+        ) = _job_response_fields(job)
         output = {
-            "status": job.state,
-            "type": job.func,
-            "exception": job.exception,
-            "traceback": job.traceback,
-            "percentage": job.percentage_progress,
-            "id": job.job_id,
-            "cancellable": job.cancellable,
-            "clearable": job.state in [State.FAILED, State.CANCELED, State.COMPLETED],
-            "facility_id": job.facility_id,
-            "extra_metadata": job.extra_metadata,
+            "status": state,
+            "type": func,
+            "percentage": percentage,
+            "id": job_id,
+            "cancellable": cancellable,
+            "clearable": state in _clearable_states,
+            "facility_id": facility_id,
+            "extra_metadata": extra_metadata,
         }
+        # Only failed jobs carry an exception and traceback, so leave the
+        # empty values out of the response for every other job.
+        if exception:
+            output["exception"] = exception
+        if traceback:
+            output["traceback"] = traceback
         return output
 
+    def _get_non_negative_int_param(self, request, name):
+        value = request.query_params.get(name, None)
+        if value is None:
+            return None
+        try:
+            value = int(value)
+        except ValueError:
+            value = -1
+        if value < 0:
+            raise serializers.ValidationError(
+                "'{}' must be a non-negative integer".format(name)
+            )
+        return value
+
+    def _user_can_read_job(self, request, job):
+        try:
+            registered_task = TaskRegistry[job.func]
+        except KeyError:
+            # Note: Temporarily including unregistered tasks until we complete
+            # our transition to to the new tasks API.
+            # After completing transition to the new tasks API, we won't be
+            # including unregistered tasks to the response list.
+            return True
+        try:
+            registered_task.check_job_permissions(request.user, job, self)
+        except PermissionDenied:
+            # `request.user` do not have permission for this job hence
+            # we we will NOT include this job in the list.
+            return False
+        return True
+
+    @method_decorator(etag(_jobs_list_etag))
     def list(self, request):
         """
         Returns a list of jobs that `request.user` has permissions for.
 
-        Accepts a query parameter named `queue` that filters jobs by `queue`.
+        Accepts a query parameter named `queue` that filters jobs by `queue`,
+        and a query parameter named `state` that filters jobs by `state`.
+
+        If a `limit` or `offset` query parameter is passed, the response is a dict
+        with that page of jobs as `results` and the total number of jobs matching
+        the filters that `request.user` can read as `count`.
+
+        The response carries an ETag, so a client polling for changes can send it
+        back in `If-None-Match` and get a 304 response while no jobs have changed.
         """
         queue = request.query_params.get("queue", None)
-
-        all_jobs = job_storage.get_all_jobs(queue=queue)
-
-        jobs_response = []
-        for job in all_jobs:
-            try:
-                registered_task = TaskRegistry[job.func]
-                registered_task.check_job_permissions(request.user, job, self)
-                jobs_response.append(self._job_to_response(job))
-            except KeyError:
-                # Note: Temporarily including unregistered tasks until we complete
-                # our transition to to the new tasks API.
-                # After completing transition to the new tasks API, we won't be
-                # including unregistered tasks to the response list.
-                jobs_response.append(self._job_to_response(job))
-            except PermissionDenied:
-                # `request.user` do not have permission for this job hence
-                # we we will NOT append this job to the list.
-                pass
-
-        return Response(jobs_response)
+        state = request.query_params.get("state", None)
+        limit = self._get_non_negative_int_param(request, "limit")
+        offset = self._get_non_negative_int_param(request, "offset")
+
+        # Permissions can depend on each job, so jobs are only paged and counted
+        # once the ones `request.user` cannot read have been filtered out.
+        jobs = [
+            job
+            for job in job_storage.get_all_jobs(queue=queue, state=state)
+            if self._user_can_read_job(request, job)
+        ]
+
+        if limit is None and offset is None:
+            return Response([self._job_to_response(job) for job in jobs])
+
+        start = offset or 0
+        page = jobs[start:] if limit is None else jobs[start : start + limit]
+
+        return Response(
+            {
+                "count": len(jobs),
+                "results": [self._job_to_response(job) for job in page],
+            }
+        )
 
     def create(self, request):
         """
@@ -135,18 +257,18 @@ class TasksViewSet(viewsets.GenericViewSet):
         """
         validated_data = self.validate_create_req_data(request)
 
-        enqueued_jobs_response = []
-
         # Once we have validated all the tasks, we are good to go!
-        for registered_task, job in validated_data:
-            # Use job_storage to enqueue rather than using the registered_task wrapper
-            # for ease of testing, so we only have to mock job_storage once.
-            job_id = job_storage.enqueue_job(
-                job, queue=registered_task.queue, priority=registered_task.priority
-            )
-            enqueued_jobs_response.append(
-                self._job_to_response(job_storage.get_job(job_id))
-            )
+        # Use job_storage to enqueue rather than using the registered_task wrapper
+        # for ease of testing, so we only have to mock job_storage once.
+        # All jobs are enqueued in one transaction, and the enqueued jobs are
+        # returned to us, so we don't need to fetch them again for the response.
+        enqueued_jobs = job_storage.enqueue_jobs(
+            [
+                (job, registered_task.queue, registered_task.priority)
+                for registered_task, job in validated_data
+            ]
+        )
+        enqueued_jobs_response = [self._job_to_response(job) for job in enqueued_jobs]
 
         if len(enqueued_jobs_response) == 1:
             enqueued_jobs_response = enqueued_jobs_response[0]
@@ -243,11 +243,16 @@ class RegisteredTask(object):
             if not permission.has_permission(user, job, view):
                 raise PermissionDenied
 
-    def validate_job_data(self, user, data):
+    def validate_job_data(self, user, data, cache=None):
         # Run validator with `user` and `data` as its argument.
+        # `cache` is an optional dict that validators can use to share lookups
+        # between the jobs of a single request.
         if "type" not in data:
             data["type"] = stringify_func(self)
-        validator = self.validator(data=data, context={"user": user})
+        context = {"user": user}
+        if cache is not None:
+            context["cache"] = cache
+        validator = self.validator(data=data, context=context)
         validator.is_valid(raise_exception=True)
 
         try:
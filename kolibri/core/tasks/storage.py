@@ -8,7 +8,6 @@ from sqlalchemy import DateTime
 from sqlalchemy import func
 from sqlalchemy import Index
 from sqlalchemy import Integer
-from sqlalchemy import or_
 from sqlalchemy import String
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.declarative import declarative_base
@@ -232,26 +231,47 @@ class Storage(object):
 
             return [self._orm_to_job(job) for job in jobs]
 
-    def get_all_jobs(self, queue=None):
-        with self.session_scope() as s:
-            q = s.query(ORMJob)
+    def _filter_jobs(self, q, queue=None, state=None):
+        if queue:
+            q = q.filter(ORMJob.queue == queue)
 
-            if queue:
-                q = q.filter(ORMJob.queue == queue)
+        if state:
+            q = q.filter(ORMJob.state == state)
 
-            orm_jobs = q.all()
+        return q
+
+    def get_all_jobs(self, queue=None, state=None):
+        """
+        Returns the jobs, optionally filtered by `queue` and `state`, ordered by
+        creation time.
+        """
+        with self.session_scope() as s:
+            q = self._filter_jobs(s.query(ORMJob), queue=queue, state=state)
+
+            orm_jobs = q.order_by(ORMJob.time_created, ORMJob.id).all()
 
             return [self._orm_to_job(o) for o in orm_jobs]
 
-    def count_all_jobs(self, queue=None):
+    def count_all_jobs(self, queue=None, state=None):
         with self.session_scope() as s:
-            q = s.query(ORMJob)
-
-            if queue:
-                q = q.filter(ORMJob.queue == queue)
+            q = self._filter_jobs(s.query(ORMJob), queue=queue, state=state)
 
             return q.count()
 
+    def get_jobs_last_modified(self, queue=None, state=None):
+        """
+        Returns a tuple of the number of jobs and the most recent time any of them
+        was updated, which together change whenever the matching jobs change.
+        """
+        with self.session_scope() as s:
+            q = self._filter_jobs(
+                s.query(func.count(ORMJob.id), func.max(ORMJob.time_updated)),
+                queue=queue,
+                state=state,
+            )
+
+            return tuple(q.one())
+
     def get_job(self, job_id):
         with self.session_scope() as session:
             job, _ = self._get_job_and_orm_job(job_id, session)
@@ -321,11 +341,7 @@ class Storage(object):
             # filter only by the finished jobs, if we are not specified to force
             if not force:
                 q = q.filter(
-                    or_(
-                        ORMJob.state == State.COMPLETED,
-                        ORMJob.state == State.FAILED,
-                        ORMJob.state == State.CANCELED,
-                    )
+                    ORMJob.state.in_([State.COMPLETED, State.FAILED, State.CANCELED])
                 )
 
             q.delete(synchronize_session=False)
@@ -400,6 +416,7 @@ class Storage(object):
                 for kwarg in kwargs:
                     setattr(job, kwarg, kwargs[kwarg])
                 orm_job.saved_job = job.to_json()
+                orm_job.time_updated = naive_utc_datetime(self._now())
                 session.add(orm_job)
                 return job, orm_job
             except JobNotFound:
@@ -487,43 +504,12 @@ class Storage(object):
         Repeat of None with a specified interval means the job will repeat forever at that
         interval.
         """
-        if not isinstance(dt, datetime):
-            raise ValueError("Time argument must be a datetime object.")
-        if not interval and repeat != 0:
-            raise ValueError("Must specify an interval if the task is repeating")
-        if dt.tzinfo is None:
-            raise ValueError(
-                "Must use a timezone aware datetime object for scheduling tasks"
-            )
-        if not isinstance(job, Job):
-            raise ValueError("Job argument must be a Job object.")
+        self._validate_schedule(dt, job, interval, repeat)
 
         with self.session_scope() as session:
-            orm_job = session.query(ORMJob).get(job.job_id)
-            if orm_job and orm_job.state not in {
-                State.COMPLETED,
-                State.FAILED,
-                State.CANCELED,
-            }:
-                # If this job is already queued or running, don't try to replace it.
-                # Call our schedule hooks anyway to ensure that job storage
-                # is synchronized with any other task runner.
-                self._run_scheduled_hooks(orm_job)
-                return job.job_id
-
-            job.state = State.QUEUED
-            orm_job = ORMJob(
-                id=job.job_id,
-                state=job.state,
-                priority=priority,
-                queue=queue,
-                interval=interval,
-                repeat=repeat,
-                retry_interval=retry_interval,
-                scheduled_time=naive_utc_datetime(dt),
-                saved_job=job.to_json(),
+            _, orm_job = self._schedule_job(
+                session, dt, job, queue, priority, interval, repeat, retry_interval
             )
-            session.merge(orm_job)
             try:
                 session.commit()
             except Exception as e:
@@ -533,6 +519,83 @@ class Storage(object):
 
             return job.job_id
 
+    def enqueue_jobs(self, jobs):
+        """
+        Add several jobs to the job queue in a single transaction.
+
+        Returns the scheduled jobs, in the same order as `jobs`, so that callers
+        do not need to fetch them back from the storage.
+
+        :param jobs: an iterable of (job, queue, priority) tuples.
+        :return: the list of scheduled Job objects.
+        """
+        dt = self._now()
+        jobs = list(jobs)
+        for job, _, _ in jobs:
+            self._validate_schedule(dt, job, 0, 0)
+
+        with self.session_scope() as session:
+            scheduled = [
+                self._schedule_job(session, dt, job, queue, priority, 0, 0, None)
+                for job, queue, priority in jobs
+            ]
+            try:
+                session.commit()
+            except Exception as e:
+                logger.error("Got an error running session.commit(): {}".format(e))
+
+            for _, orm_job in scheduled:
+                self._run_scheduled_hooks(orm_job)
+
+            return [job for job, _ in scheduled]
+
+    def _validate_schedule(self, dt, job, interval, repeat):
+        if not isinstance(dt, datetime):
+            raise ValueError("Time argument must be a datetime object.")
+        if not interval and repeat != 0:
+            raise ValueError("Must specify an interval if the task is repeating")
+        if dt.tzinfo is None:
+            raise ValueError(
+                "Must use a timezone aware datetime object for scheduling tasks"
+            )
+        if not isinstance(job, Job):
+            raise ValueError("Job argument must be a Job object.")
+
+    def _schedule_job(
+        self, session, dt, job, queue, priority, interval, repeat, retry_interval
+    ):
+        """
+        Stage the job in the session, without committing.
+
+        Returns the scheduled job and its ORMJob. If a matching job is already
+        queued or running, that job is returned in place of the one passed in.
+        """
+        orm_job = session.query(ORMJob).get(job.job_id)
+        if orm_job and orm_job.state not in {
+            State.COMPLETED,
+            State.FAILED,
+            State.CANCELED,
+        }:
+            # If this job is already queued or running, don't try to replace it.
+            # Our schedule hooks are still called for it to ensure that job storage
+            # is synchronized with any other task runner.
+            return self._orm_to_job(orm_job), orm_job
+
+        job.state = State.QUEUED
+        orm_job = ORMJob(
+            id=job.job_id,
+            state=job.state,
+            priority=priority,
+            queue=queue,
+            interval=interval,
+            repeat=repeat,
+            retry_interval=retry_interval,
+            scheduled_time=naive_utc_datetime(dt),
+            saved_job=job.to_json(),
+            time_updated=naive_utc_datetime(self._now()),
+        )
+        return job, session.merge(orm_job)
+
     def _run_scheduled_hooks(self, orm_job):
         for schedule_hook in self.schedule_hooks:
             schedule_hook(
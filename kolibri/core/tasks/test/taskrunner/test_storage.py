@@ -57,6 +57,42 @@ class TestBackend:
         # Does the job have the right state (QUEUED)?
         assert new_job.state == State.QUEUED
 
+    def test_can_enqueue_many_jobs(self, defaultbackend, func):
+        jobs = [Job(func), Job(func), Job(func)]
+
+        enqueued_jobs = defaultbackend.enqueue_jobs(
+            [(job, QUEUE, Priority.REGULAR) for job in jobs]
+        )
+
+        # Are the jobs returned in the order they were given, ready to be used?
+        job_ids = [job.job_id for job in enqueued_jobs]
+        assert job_ids == [job.job_id for job in jobs]
+        assert all(job.state == State.QUEUED for job in enqueued_jobs)
+
+        # Are the jobs stored?
+        for job_id in job_ids:
+            assert defaultbackend.get_job(job_id).state == State.QUEUED
+
+    def test_can_filter_jobs_by_state(self, defaultbackend, func):
+        job_ids = [defaultbackend.enqueue_job(Job(func), QUEUE) for _ in range(3)]
+        defaultbackend.complete_job(job_ids[0])
+
+        assert defaultbackend.count_all_jobs(queue=QUEUE) == 3
+        assert defaultbackend.count_all_jobs(queue=QUEUE, state=State.QUEUED) == 2
+
+        jobs = defaultbackend.get_all_jobs(queue=QUEUE, state=State.QUEUED)
+        assert sorted(job.job_id for job in jobs) == sorted(job_ids[1:])
+
+    def test_jobs_last_modified_changes_with_jobs(self, defaultbackend, func):
+        job_id = defaultbackend.enqueue_job(Job(func), QUEUE)
+        last_modified = defaultbackend.get_jobs_last_modified(queue=QUEUE)
+        assert last_modified[0] == 1
+
+        # Make sure the update lands on a later clock tick
+        time.sleep(0.1)
+        defaultbackend.mark_job_as_running(job_id)
+        assert defaultbackend.get_jobs_last_modified(queue=QUEUE) != last_modified
+
     def test_can_cancel_nonrunning_job(self, defaultbackend, simplejob):
         job_id = defaultbackend.enqueue_job(simplejob, QUEUE)
 
@@ -1,5 +1,5 @@
+from django.test import TestCase
 from django.urls import reverse
-from mock import call
 from mock import Mock
 from mock import patch
 from rest_framework import serializers
@@ -10,6 +10,7 @@ from kolibri.core.auth.models import FacilityUser
 from kolibri.core.auth.test.test_api import FacilityUserFactory
 from kolibri.core.device.models import DevicePermissions
 from kolibri.core.device.models import DeviceSettings
+from kolibri.core.tasks.api import TasksViewSet
 from kolibri.core.tasks.decorators import register_task
 from kolibri.core.tasks.exceptions import JobNotFound
 from kolibri.core.tasks.job import Job
@@ -19,6 +20,7 @@ from kolibri.core.tasks.permissions import IsSuperAdmin
 from kolibri.core.tasks.registry import RegisteredTask
 from kolibri.core.tasks.registry import TaskRegistry
 from kolibri.core.tasks.validation import JobValidator
+from kolibri.utils import conf
 
 
 DUMMY_PASSWORD = "password"
@@ -92,6 +94,27 @@ class TaskAPITestCase(BaseAPITestCase):
         self.assertEqual(response.status_code, 404)
 
 
+class JobToResponseTestCase(TestCase):
+    def test_exception_only_included_for_failed_jobs(self):
+        def add(x, y):
+            return x + y
+
+        viewset = TasksViewSet()
+        job = Job(add, state=State.RUNNING)
+
+        response = viewset._job_to_response(job)
+        self.assertEqual(response["type"], "kolibri.core.tasks.test.test_api.add")
+        self.assertNotIn("exception", response)
+        self.assertNotIn("traceback", response)
+
+        job.state = State.FAILED
+        job.exception = "ValueError"
+        job.traceback = "Traceback"
+        response = viewset._job_to_response(job)
+        self.assertEqual(response["exception"], "ValueError")
+        self.assertEqual(response["traceback"], "Traceback")
+
+
 @patch("kolibri.core.tasks.api.job_storage")
 class CreateTaskAPITestCase(BaseAPITestCase):
     def setUp(self):
@@ -236,10 +259,9 @@ class CreateTaskAPITestCase(BaseAPITestCase):
 
         TaskRegistry["kolibri.core.tasks.test.test_api.add"] = add
 
-        mock_job_storage.enqueue_job.return_value = "test"
-        mock_job_storage.get_job.return_value = fake_job(
-            state=State.QUEUED, job_id="test"
-        )
+        mock_job_storage.enqueue_jobs.return_value = [
+            fake_job(state=State.QUEUED, job_id="test")
+        ]
 
         response = self.client.post(
             reverse("kolibri:core:task-list"),
@@ -250,8 +272,6 @@ class CreateTaskAPITestCase(BaseAPITestCase):
         expected_response = {
             "id": "test",
             "status": "QUEUED",
-            "exception": "",
-            "traceback": "",
             "percentage": 0,
             "type": "",
             "cancellable": False,
@@ -267,23 +287,23 @@ class CreateTaskAPITestCase(BaseAPITestCase):
         # Do we call enqueue the right way i.e. are we passing
         # the user's facility_id and the request's data as keyword args
         # to enqueue method?
-        mock_job_storage.enqueue_job.assert_called_once()
+        mock_job_storage.enqueue_jobs.assert_called_once()
+        enqueued_job, _, _ = mock_job_storage.enqueue_jobs.call_args[0][0][0]
 
         # Do we strip out any unexpected keys from the request data?
-        self.assertEqual(mock_job_storage.enqueue_job.call_args[0][0].kwargs, {})
+        self.assertEqual(enqueued_job.kwargs, {})
 
-        # Do we retrieve the task from db to ready the response?
-        mock_job_storage.get_job.assert_called_once_with("test")
+        # Do we ready the response without fetching the task from db again?
+        mock_job_storage.get_job.assert_not_called()
 
     def test_api_handles_bulk_task_without_validator(self, mock_job_storage):
         @register_task(permission_classes=[IsSuperAdmin])
         def add(**kwargs):
             return kwargs["x"] + kwargs["y"]
 
-        mock_job_storage.enqueue_job.return_value = "test"
-        mock_job_storage.get_job.return_value = fake_job(
-            state=State.QUEUED, job_id="test"
-        )
+        mock_job_storage.enqueue_jobs.return_value = [
+            fake_job(state=State.QUEUED, job_id="test")
+        ] * 2
 
         TaskRegistry["kolibri.core.tasks.test.test_api.add"] = add
 
@@ -302,8 +322,6 @@ class CreateTaskAPITestCase(BaseAPITestCase):
             {
                 "id": "test",
                 "status": "QUEUED",
-                "exception": "",
-                "traceback": "",
                 "percentage": 0,
                 "type": "",
                 "cancellable": False,
@@ -314,8 +332,6 @@ class CreateTaskAPITestCase(BaseAPITestCase):
             {
                 "id": "test",
                 "status": "QUEUED",
-                "exception": "",
-                "traceback": "",
                 "percentage": 0,
                 "type": "",
                 "cancellable": False,
@@ -332,7 +348,8 @@ class CreateTaskAPITestCase(BaseAPITestCase):
         # Do we call enqueue the right way i.e. are we passing
         # the user's facility_id and the request's data as keyword args
         # to enqueue method?
-        self.assertEqual(mock_job_storage.enqueue_job.call_count, 2)
+        mock_job_storage.enqueue_jobs.assert_called_once()
+        self.assertEqual(len(mock_job_storage.enqueue_jobs.call_args[0][0]), 2)
 
         for call_args in mock_job_storage.call_args_list:
             self.assertEqual(call_args[0][0].kwargs, {"kolibri": "fly"})
@@ -344,9 +361,29 @@ class CreateTaskAPITestCase(BaseAPITestCase):
                 },
             )
 
-        # Do we retrieve the task from db to ready the response?
-        self.assertEqual(mock_job_storage.get_job.call_count, 2)
-        mock_job_storage.get_job.assert_has_calls([call("test"), call("test")])
+        # Do we ready the response without fetching the task from db again?
+        mock_job_storage.get_job.assert_not_called()
+
+    def test_api_rejects_too_many_tasks(self, mock_job_storage):
+        @register_task(permission_classes=[IsSuperAdmin])
+        def add(**kwargs):
+            return kwargs["x"] + kwargs["y"]
+
+        TaskRegistry["kolibri.core.tasks.test.test_api.add"] = add
+
+        request_payload = [
+            {"type": "kolibri.core.tasks.test.test_api.add", "kolibri": "fly"},
+        ] * 3
+
+        with patch.dict(conf.OPTIONS["Tasks"], {"MAX_BULK_TASKS": 2}):
+            response = self.client.post(
+                reverse("kolibri:core:task-list"),
+                request_payload,
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, 400)
+        mock_job_storage.enqueue_jobs.assert_not_called()
 
     def test_api_handles_single_task_with_validator(self, mock_job_storage):
         test = self
@@ -372,10 +409,13 @@ class CreateTaskAPITestCase(BaseAPITestCase):
 
         TaskRegistry["kolibri.core.tasks.test.test_api.add"] = add
 
-        mock_job_storage.enqueue_job.return_value = "test"
-        mock_job_storage.get_job.return_value = fake_job(
-            state=State.QUEUED, job_id="test", extra_metadata={"facility": "kolibri HQ"}
-        )
+        mock_job_storage.enqueue_jobs.return_value = [
+            fake_job(
+                state=State.QUEUED,
+                job_id="test",
+                extra_metadata={"facility": "kolibri HQ"},
+            )
+        ]
 
         response = self.client.post(
             reverse("kolibri:core:task-list"),
@@ -386,8 +426,6 @@ class CreateTaskAPITestCase(BaseAPITestCase):
         expected_response = {
             "id": "test",
             "status": "QUEUED",
-            "exception": "",
-            "traceback": "",
             "percentage": 0,
             "type": "",
             "cancellable": False,
@@ -405,13 +443,12 @@ class CreateTaskAPITestCase(BaseAPITestCase):
         # Do we call enqueue the right way i.e. are we passing
         # the user's facility_id and the request's data as keyword args
         # to enqueue method?
-        mock_job_storage.enqueue_job.assert_called_once()
+        mock_job_storage.enqueue_jobs.assert_called_once()
+        enqueued_job, _, _ = mock_job_storage.enqueue_jobs.call_args[0][0][0]
 
+        self.assertEqual(enqueued_job.kwargs, {"x": 0, "y": 42})
         self.assertEqual(
-            mock_job_storage.enqueue_job.call_args[0][0].kwargs, {"x": 0, "y": 42}
-        )
-        self.assertEqual(
-            mock_job_storage.enqueue_job.call_args[0][0].extra_metadata,
+            enqueued_job.extra_metadata,
             {
                 "facility": "kolibri HQ",
                 "started_by": self.superuser.id,
@@ -419,8 +456,8 @@ class CreateTaskAPITestCase(BaseAPITestCase):
             },
         )
 
-        # Do we retrieve the task from db to ready the response?
-        mock_job_storage.get_job.assert_called_once_with("test")
+        # Do we ready the response without fetching the task from db again?
+        mock_job_storage.get_job.assert_not_called()
 
     def test_api_handles_bulk_task_with_validator(self, mock_job_storage):
         test = self
@@ -446,10 +483,13 @@ class CreateTaskAPITestCase(BaseAPITestCase):
 
         TaskRegistry["kolibri.core.tasks.test.test_api.add"] = add
 
-        mock_job_storage.enqueue_job.return_value = "test"
-        mock_job_storage.get_job.return_value = fake_job(
-            state=State.QUEUED, job_id="test", extra_metadata={"facility": "kolibri HQ"}
-        )
+        mock_job_storage.enqueue_jobs.return_value = [
+            fake_job(
+                state=State.QUEUED,
+                job_id="test",
+                extra_metadata={"facility": "kolibri HQ"},
+            )
+        ] * 2
 
         request_payload = [
             {"type": "kolibri.core.tasks.test.test_api.add", "kolibri": "fly"},
@@ -468,8 +508,6 @@ class CreateTaskAPITestCase(BaseAPITestCase):
             {
                 "id": "test",
                 "status": "QUEUED",
-                "exception": "",
-                "traceback": "",
                 "percentage": 0,
                 "type": "",
                 "cancellable": False,
@@ -482,8 +520,6 @@ class CreateTaskAPITestCase(BaseAPITestCase):
             {
                 "id": "test",
                 "status": "QUEUED",
-                "exception": "",
-                "traceback": "",
                 "percentage": 0,
                 "type": "",
                 "cancellable": False,
@@ -502,7 +538,8 @@ class CreateTaskAPITestCase(BaseAPITestCase):
         # Do we call enqueue the right way i.e. are we passing
         # the user's facility_id and the request's data as keyword args
         # to enqueue method?
-        self.assertEqual(mock_job_storage.enqueue_job.call_count, 2)
+        mock_job_storage.enqueue_jobs.assert_called_once()
+        self.assertEqual(len(mock_job_storage.enqueue_jobs.call_args[0][0]), 2)
 
         for call_args in mock_job_storage.call_args_list:
             self.assertEqual(call_args[0][0].kwargs, {"x": 0, "y": 42})
@@ -515,9 +552,8 @@ class CreateTaskAPITestCase(BaseAPITestCase):
                 },
             )
 
-        # Do we retrieve the task from db to ready the response?
-        self.assertEqual(mock_job_storage.get_job.call_count, 2)
-        mock_job_storage.get_job.assert_has_calls([call("test"), call("test")])
+        # Do we ready the response without fetching the task from db again?
+        mock_job_storage.get_job.assert_not_called()
 
 
 @patch("kolibri.core.tasks.api.job_storage")
@@ -562,8 +598,6 @@ class TaskManagementAPITestCase(BaseAPITestCase):
         self.jobs_response = [
             {
                 "status": State.QUEUED,
-                "exception": None,
-                "traceback": "",
                 "percentage": 0,
                 "type": "kolibri.core.tasks.test.test_api.add",
                 "id": "0",
@@ -574,8 +608,6 @@ class TaskManagementAPITestCase(BaseAPITestCase):
             },
             {
                 "status": State.QUEUED,
-                "exception": None,
-                "traceback": "",
                 "percentage": 0,
                 "type": "kolibri.core.tasks.test.test_api.multiply",
                 "id": "1",
@@ -586,8 +618,6 @@ class TaskManagementAPITestCase(BaseAPITestCase):
             },
             {
                 "status": State.QUEUED,
-                "exception": None,
-                "traceback": "",
                 "percentage": 0,
                 "type": "kolibri.core.tasks.test.test_api.subtract",
                 "id": "2",
@@ -608,7 +638,7 @@ class TaskManagementAPITestCase(BaseAPITestCase):
         response = self.client.get(reverse("kolibri:core:task-list"))
 
         self.assertEqual(response.data, self.jobs_response)
-        mock_job_storage.get_all_jobs.assert_called_once_with(queue=None)
+        mock_job_storage.get_all_jobs.assert_called_once_with(queue=None, state=None)
 
     def test_can_manage_content_can_only_view_can_manage_content_jobs(
         self, mock_job_storage
@@ -619,7 +649,7 @@ class TaskManagementAPITestCase(BaseAPITestCase):
         response = self.client.get(reverse("kolibri:core:task-list"))
 
         self.assertEqual(response.data, [self.jobs_response[1], self.jobs_response[2]])
-        mock_job_storage.get_all_jobs.assert_called_once_with(queue=None)
+        mock_job_storage.get_all_jobs.assert_called_once_with(queue=None, state=None)
 
     def test_can_list_queue_specific_jobs(self, mock_job_storage):
         mock_job_storage.get_all_jobs.return_value = self.jobs[:2]
@@ -630,7 +660,87 @@ class TaskManagementAPITestCase(BaseAPITestCase):
         )
 
         self.assertEqual(response.data, self.jobs_response[:2])
-        mock_job_storage.get_all_jobs.assert_called_once_with(queue="kolibri")
+        mock_job_storage.get_all_jobs.assert_called_once_with(
+            queue="kolibri", state=None
+        )
+
+    def test_can_list_page_of_jobs(self, mock_job_storage):
+        mock_job_storage.get_all_jobs.return_value = self.jobs
+        self.client.login(username=self.superuser.username, password=DUMMY_PASSWORD)
+
+        response = self.client.get(
+            reverse("kolibri:core:task-list"),
+            {"limit": 1, "offset": 1, "state": State.QUEUED},
+        )
+
+        self.assertEqual(
+            response.data, {"count": 3, "results": self.jobs_response[1:2]}
+        )
+        mock_job_storage.get_all_jobs.assert_called_once_with(
+            queue=None, state=State.QUEUED
+        )
+
+    def test_page_of_jobs_only_counts_readable_jobs(self, mock_job_storage):
+        mock_job_storage.get_all_jobs.return_value = self.jobs
+        self.client.login(username=self.facility2user.username, password=DUMMY_PASSWORD)
+
+        response = self.client.get(reverse("kolibri:core:task-list"), {"limit": 1})
+        self.assertEqual(
+            response.data, {"count": 2, "results": self.jobs_response[1:2]}
+        )
+
+        response = self.client.get(reverse("kolibri:core:task-list"), {"offset": 1})
+        self.assertEqual(
+            response.data, {"count": 2, "results": self.jobs_response[2:3]}
+        )
+
+    def test_list_rejects_invalid_limit(self, mock_job_storage):
+        self.client.login(username=self.superuser.username, password=DUMMY_PASSWORD)
+
+        response = self.client.get(reverse("kolibri:core:task-list"), {"limit": "-1"})
+
+        self.assertEqual(response.status_code, 400)
+        mock_job_storage.get_all_jobs.assert_not_called()
+
+    def test_list_not_modified_until_jobs_change(self, mock_job_storage):
+        mock_job_storage.get_all_jobs.return_value = self.jobs
+        mock_job_storage.get_jobs_last_modified.return_value = (3, "2021-01-01")
+        self.client.login(username=self.superuser.username, password=DUMMY_PASSWORD)
+
+        response = self.client.get(reverse("kolibri:core:task-list"))
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        response = self.client.get(
+            reverse("kolibri:core:task-list"), HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 304)
+        mock_job_storage.get_all_jobs.assert_called_once()
+
+        mock_job_storage.get_jobs_last_modified.return_value = (3, "2021-01-02")
+        response = self.client.get(
+            reverse("kolibri:core:task-list"), HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, self.jobs_response)
+
+    def test_list_modified_when_user_permissions_change(self, mock_job_storage):
+        mock_job_storage.get_all_jobs.return_value = self.jobs
+        mock_job_storage.get_jobs_last_modified.return_value = (3, "2021-01-01")
+        self.client.login(username=self.facility2user.username, password=DUMMY_PASSWORD)
+
+        response = self.client.get(reverse("kolibri:core:task-list"))
+        self.assertEqual(response.data, [self.jobs_response[1], self.jobs_response[2]])
+        etag = response["ETag"]
+
+        DevicePermissions.objects.filter(user=self.facility2user).update(
+            can_manage_content=False
+        )
+        response = self.client.get(
+            reverse("kolibri:core:task-list"), HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, [])
 
     def test_task_clearable_flag(self, mock_job_storage):
         self.client.login(username=self.superuser.username, password=DUMMY_PASSWORD)
@@ -0,0 +1,86 @@
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import mock
+import requests
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from six.moves.urllib.request import Request
+
+from kolibri.core.auth.models import FacilityDataset
+from kolibri.core.auth.models import FacilityUser
+from kolibri.core.auth.test.helpers import setup_device
+from kolibri.plugins.user_profile.viewsets import remote_session
+from kolibri.plugins.user_profile.viewsets import REMOTE_REQUEST_TIMEOUT
+
+DUMMY_PASSWORD = "password"
+
+
+class OnMyOwnSetupTestCase(APITestCase):
+    def setUp(self):
+        self.facility, _ = setup_device()
+        self.learner = FacilityUser.objects.create(
+            username="learner", facility=self.facility
+        )
+        self.learner.set_password(DUMMY_PASSWORD)
+        self.learner.save()
+        self.client.login(username=self.learner.username, password=DUMMY_PASSWORD)
+        self.url = reverse("kolibri:kolibri.plugins.user_profile:onmyownsetup")
+
+    def test_on_my_own_setup_is_cached_until_set(self):
+        response = self.client.get(self.url)
+        self.assertFalse(response.data["on_my_own_setup"])
+
+        # A change that does not go through the facility is only seen once the
+        # cached value expires.
+        FacilityDataset.objects.filter(id=self.facility.dataset_id).update(
+            extra_fields={"on_my_own_setup": True}
+        )
+        response = self.client.get(self.url)
+        self.assertFalse(response.data["on_my_own_setup"])
+
+        self.facility.on_my_own_setup = True
+        response = self.client.get(self.url)
+        self.assertTrue(response.data["on_my_own_setup"])
+
+
+@mock.patch("kolibri.plugins.user_profile.viewsets.remote_session")
+class RemoteFacilityUserTestCase(APITestCase):
+    def setUp(self):
+        self.url = reverse("kolibri:kolibri.plugins.user_profile:remotefacilityuser")
+        self.params = {
+            "baseurl": "http://peer.test/",
+            "username": "learner",
+            "facility": "facility_id",
+        }
+
+    def test_remote_request_has_timeout(self, remote_session_mock):
+        remote_session_mock.get.return_value.status_code = 200
+        remote_session_mock.get.return_value.json.return_value = [{"id": "1"}]
+
+        response = self.client.get(self.url, self.params)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, [{"id": "1"}])
+        self.assertEqual(
+            remote_session_mock.get.call_args[1]["timeout"], REMOTE_REQUEST_TIMEOUT
+        )
+
+    def test_remote_request_timeout_is_validation_error(self, remote_session_mock):
+        remote_session_mock.get.side_effect = requests.Timeout()
+
+        response = self.client.get(self.url, self.params)
+
+        self.assertEqual(response.status_code, 400)
+
+
+class RemoteSessionTestCase(APITestCase):
+    def test_remote_session_does_not_store_cookies(self):
+        response = mock.Mock()
+        response.info.return_value.get_all.return_value = ["sessionid=abc; Path=/"]
+        response.info.return_value.getheaders.return_value = ["sessionid=abc; Path=/"]
+
+        remote_session.cookies.extract_cookies(response, Request("http://peer.test/"))
+
+        self.assertEqual(len(remote_session.cookies), 0)
@@ -1,11 +1,32 @@
 import requests
+from requests.adapters import HTTPAdapter
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from six.moves.http_cookiejar import DefaultCookiePolicy
 
+from kolibri.core.auth.models import Facility
+from kolibri.core.auth.models import ON_MY_OWN_SETUP_CACHE_KEY
 from kolibri.core.device.utils import get_device_setting
+from kolibri.core.utils.cache import process_cache
 from kolibri.core.utils.urls import reverse_remote
 
+# The setup is rarely changed but read on every load of the page, so a short
+# lived cache saves the facility and dataset lookups on repeated loads.
+ON_MY_OWN_SETUP_CACHE_TIMEOUT = 30
+
+# Connect and read timeouts for requests to the remote facility, so that a slow
+# or unreachable peer cannot hold on to the worker serving this request.
+REMOTE_REQUEST_TIMEOUT = (3.05, 10)
+
+# Shared between requests to reuse connections to the same remote facility.
+# It is shared between users too, so it must never store cookies from remote
+# responses; no domain is allowed to set them.
+remote_session = requests.Session()
+remote_session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+remote_session.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+remote_session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+
 
 class OnMyOwnSetupViewset(APIView):
     """
@@ -18,14 +39,25 @@ class OnMyOwnSetupViewset(APIView):
         subset_of_users_device = get_device_setting(
             "subset_of_users_device", default=False
         )
-        user_facility = self.request.user.facility
         return Response(
             {
-                "on_my_own_setup": user_facility.on_my_own_setup,
+                "on_my_own_setup": self._get_on_my_own_setup(request.user.facility_id),
                 "lod": subset_of_users_device,
             }
         )
 
+    def _get_on_my_own_setup(self, facility_id):
+        cache_key = ON_MY_OWN_SETUP_CACHE_KEY.format(facility_id)
+        on_my_own_setup = process_cache.get(cache_key)
+        if on_my_own_setup is None:
+            on_my_own_setup = (
+                Facility.objects.select_related("dataset")
+                .get(id=facility_id)
+                .on_my_own_setup
+            )
+            process_cache.set(cache_key, on_my_own_setup, ON_MY_OWN_SETUP_CACHE_TIMEOUT)
+        return on_my_own_setup
+
 
 class RemoteFacilityUserViewset(APIView):
     def get(self, request):
@@ -36,8 +68,10 @@ class RemoteFacilityUserViewset(APIView):
             raise ValidationError(detail="Both username and facility are required")
         url = reverse_remote(baseurl, "kolibri:core:publicsearchuser-list")
         try:
-            response = requests.get(
-                url, params={"facility": facility, "search": username}
+            response = remote_session.get(
+                url,
+                params={"facility": facility, "search": username},
+                timeout=REMOTE_REQUEST_TIMEOUT,
             )
             if response.status_code == 200:
                 return Response(response.json())
@@ -692,6 +692,14 @@ base_option_spec = {
                 as the internal handling is sufficient for Kolibri's task running.
             """,
         },
+        "MAX_BULK_TASKS": {
+            "type": "integer",
+            "default": 500,
+            "description": """
+                The maximum number of tasks that can be started by a single request to the tasks API.
+                Larger requests are rejected, rather than tying up the server validating and enqueueing them.
+            """,
+        },
     },
 }
 